@@ -8,7 +8,7 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 from .constants import DEFAULT_APP_VERSION, DEFAULT_CHART_VERSION, K8sFields
-from .types import ChartGenerationError, ChartGeneratorProtocol, ExportResult, K8sObject
+from .types import ChartGenerationError, ChartGeneratorProtocol, ExportResult, K8sManifest, K8sObject
 from .utils import StringUtils
 
 
@@ -98,10 +98,10 @@ class ChartGenerator(ChartGeneratorProtocol):
         chart_path = Path(output_path)
         templates_path = chart_path / "templates"
         
-        # Extract manifest details
-        kind = str(manifest.get(K8sFields.KIND, "resource"))
-        metadata = manifest.get(K8sFields.METADATA, {})
-        name = metadata.get(K8sFields.NAME, "resource") if isinstance(metadata, dict) else "resource"
+        # Extract the well-known fields once into slot attributes
+        record = K8sManifest.from_dict(manifest)
+        kind = record.kind or "resource"
+        name = record.name or "resource"
         
         # Generate filename
         safe_name = StringUtils.slugify(str(name))
@@ -5,10 +5,12 @@ import argparse
 import importlib.util
 import json
 import logging
+import os
 import shlex
 import shutil
 import subprocess
 import sys
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -33,96 +35,372 @@ _YAML_SPEC.loader.exec_module(yaml)
 
 # Config management functions
 def get_config_dir() -> Path:
-    """Get the configuration directory."""
-    config_dir = Path.home() / ".config" / "rancher-helm-exporter"
+    """Get the configuration directory.
+
+    RANCHER_HELM_EXPORTER_CONFIG_DIR overrides the default location so
+    tests (and parallel CI workers) can point each process at its own
+    isolated directory instead of sharing ~/.config.
+    """
+    override = os.environ.get("RANCHER_HELM_EXPORTER_CONFIG_DIR")
+    if override:
+        config_dir = Path(override)
+    else:
+        config_dir = Path.home() / ".config" / "rancher-helm-exporter"
     config_dir.mkdir(parents=True, exist_ok=True)
     return config_dir
 
 
+# orjson is an optional accelerator for the saved-configs log; fall back to
+# the stdlib encoder with a compact separator layout when it is absent.
+if importlib.util.find_spec("orjson") is not None:
+    import orjson
+
+    def _dump_json_line(obj: Dict[str, Any]) -> bytes:
+        return orjson.dumps(obj)
+
+    def _load_json_bytes(data: bytes) -> Dict[str, Any]:
+        return orjson.loads(data)
+else:
+    def _dump_json_line(obj: Dict[str, Any]) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def _load_json_bytes(data: bytes) -> Dict[str, Any]:
+        return json.loads(data)
+
+
+# Saved configs persist as an append-only JSON-lines log: a save or delete is
+# one appended record instead of a full re-serialization of every entry. The
+# replayed dict is cached keyed by file mtime so the log is only parsed when
+# it actually changed on disk.
+_CONFIG_CACHE: Optional[Dict[str, Dict[str, Any]]] = None
+_CONFIG_CACHE_MTIME: Optional[float] = None
+_CONFIG_CACHE_PATH: Optional[Path] = None
+_CONFIG_LOG_RECORDS = 0
+
+# Rewrite the log once it holds this many records per live entry.
+_CONFIG_LOG_COMPACT_RATIO = 4
+
+
+def _format_saved_at(saved_at: Any) -> str:
+    """Render a saved_at timestamp (ns int, or legacy ISO string) for display."""
+    if isinstance(saved_at, int):
+        try:
+            return datetime.fromtimestamp(saved_at / 1e9).strftime("%Y-%m-%d %H:%M")
+        except (OverflowError, OSError, ValueError):
+            return "Unknown"
+    if isinstance(saved_at, str):
+        try:
+            return datetime.fromisoformat(saved_at).strftime("%Y-%m-%d %H:%M")
+        except ValueError:
+            return saved_at
+    return "Unknown"
+
+
+def _config_log_path(config_dir: Path) -> Path:
+    return config_dir / "saved_configs.jsonl"
+
+
+def _rewrite_config_log(log_file: Path, payload: bytes) -> None:
+    """Atomically replace the log: write a sibling tempfile, then rename it.
+
+    A crash mid-rewrite leaves the old log intact instead of a truncated
+    file that would silently read back as "no saved configs".
+    """
+    tmp_file = log_file.with_suffix(".jsonl.tmp")
+    tmp_file.write_bytes(payload)
+    os.replace(tmp_file, log_file)
+
+
+def _legacy_config_path(config_dir: Path) -> Path:
+    return config_dir / "saved_configs.json"
+
+
+def _config_record(name: str, entry: Dict[str, Any]) -> bytes:
+    return _dump_json_line(
+        {
+            "op": "put",
+            "name": name,
+            "saved_at": entry.get("saved_at"),
+            "config": entry.get("config"),
+        }
+    ) + b"\n"
+
+
+def _store_config_cache(configs: Dict[str, Dict[str, Any]], log_file: Path) -> None:
+    """Remember configs just written so the next load skips the replay."""
+    global _CONFIG_CACHE, _CONFIG_CACHE_MTIME, _CONFIG_CACHE_PATH
+    try:
+        _CONFIG_CACHE_MTIME = log_file.stat().st_mtime
+        _CONFIG_CACHE = configs
+        _CONFIG_CACHE_PATH = log_file
+    except OSError:
+        _invalidate_config_cache()
+
+
+def _invalidate_config_cache() -> None:
+    global _CONFIG_CACHE, _CONFIG_CACHE_MTIME, _CONFIG_CACHE_PATH, _CONFIG_LOG_RECORDS
+    global _CONFIG_NAMES, _CONFIG_NAMES_MTIME
+    _CONFIG_CACHE = None
+    _CONFIG_CACHE_MTIME = None
+    _CONFIG_CACHE_PATH = None
+    _CONFIG_LOG_RECORDS = 0
+    # Drop the memoized name list too: after a config-dir switch the new
+    # log's mtime could coincide with the old one and serve stale names.
+    _CONFIG_NAMES = None
+    _CONFIG_NAMES_MTIME = None
+
+
+def _replay_config_log(log_file: Path) -> "tuple[Dict[str, Dict[str, Any]], int]":
+    """Rebuild the configs dict from the log; later records win."""
+    configs: Dict[str, Dict[str, Any]] = {}
+    records = 0
+    # Slurp the whole log in one read: configs logs are small, and
+    # splitlines on bytes skips the per-line readline machinery.
+    for line in log_file.read_bytes().splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        records += 1
+        try:
+            record = _load_json_bytes(line)
+        except Exception:
+            continue
+        name = record.get("name")
+        if not isinstance(name, str):
+            continue
+        if record.get("op") == "del":
+            configs.pop(name, None)
+        else:
+            configs[name] = {
+                "config": record.get("config"),
+                "saved_at": record.get("saved_at"),
+                "name": name,
+            }
+    return configs, records
+
+
+def _migrate_legacy_configs(legacy_file: Path, log_file: Path) -> None:
+    """Convert a pre-log saved_configs.json into the JSON-lines format."""
+    try:
+        configs = _load_json_bytes(legacy_file.read_bytes())
+        if isinstance(configs, dict):
+            _rewrite_config_log(
+                log_file,
+                b"".join(
+                    _config_record(name, entry)
+                    for name, entry in configs.items()
+                    if isinstance(entry, dict)
+                ),
+            )
+        legacy_file.unlink()
+    except Exception:
+        pass
+
+
+def _maybe_compact_config_log(configs: Dict[str, Dict[str, Any]], log_file: Path) -> None:
+    """Rewrite the log as one record per live entry once it grows stale-heavy."""
+    global _CONFIG_LOG_RECORDS
+    if _CONFIG_LOG_RECORDS <= max(len(configs), 1) * _CONFIG_LOG_COMPACT_RATIO:
+        return
+    try:
+        _rewrite_config_log(
+            log_file,
+            b"".join(_config_record(name, entry) for name, entry in configs.items()),
+        )
+        _CONFIG_LOG_RECORDS = len(configs)
+        _store_config_cache(configs, log_file)
+    except Exception:
+        _invalidate_config_cache()
+
+
 def save_config(name: str, config: Dict[str, Any]) -> None:
     """Save a configuration with a given name."""
+    global _CONFIG_LOG_RECORDS
     config_dir = get_config_dir()
-    configs_file = config_dir / "saved_configs.json"
+    log_file = _config_log_path(config_dir)
 
-    # Load existing configs
-    configs = {}
-    if configs_file.exists():
-        try:
-            with configs_file.open('r', encoding='utf-8') as f:
-                configs = json.load(f)
-        except Exception:
-            configs = {}
+    configs = dict(load_all_configs())
 
     # Add new config with metadata
     config_with_meta = {
         "config": config,
-        "saved_at": datetime.now().isoformat(),
+        # Integer nanoseconds: compact in the log and compares without parsing.
+        "saved_at": time.time_ns(),
         "name": name
     }
 
     configs[name] = config_with_meta
 
-    # Save back to file
+    # Append one record instead of rewriting every saved entry
     try:
-        with configs_file.open('w', encoding='utf-8') as f:
-            json.dump(configs, f, indent=2)
+        with log_file.open("ab") as f:
+            f.write(_config_record(name, config_with_meta))
+        _CONFIG_LOG_RECORDS += 1
+        _store_config_cache(configs, log_file)
+        _maybe_compact_config_log(configs, log_file)
         print(f"Configuration saved: {name}")
     except Exception as e:
         print(f"Failed to save config: {e}")
 
 
+def save_all_configs(mapping: Dict[str, Dict[str, Any]]) -> None:
+    """Save several configurations in one appended write.
+
+    Callers saving a batch through save_config pay one log append, cache
+    store, and compaction check per entry; this builds every record in
+    memory first and writes them with a single append.
+    """
+    global _CONFIG_LOG_RECORDS
+    if not mapping:
+        return
+    config_dir = get_config_dir()
+    log_file = _config_log_path(config_dir)
+
+    configs = dict(load_all_configs())
+    saved_at = time.time_ns()
+    records = []
+    for name, config in mapping.items():
+        config_with_meta = {
+            "config": config,
+            "saved_at": saved_at,
+            "name": name,
+        }
+        configs[name] = config_with_meta
+        records.append(_config_record(name, config_with_meta))
+
+    try:
+        with log_file.open("ab") as f:
+            f.write(b"".join(records))
+        _CONFIG_LOG_RECORDS += len(records)
+        _store_config_cache(configs, log_file)
+        _maybe_compact_config_log(configs, log_file)
+        print(f"Configurations saved: {len(records)}")
+    except Exception as e:
+        print(f"Failed to save configs: {e}")
+
+
 def load_all_configs() -> Dict[str, Dict[str, Any]]:
     """Load all saved configurations."""
+    global _CONFIG_CACHE, _CONFIG_CACHE_MTIME, _CONFIG_CACHE_PATH, _CONFIG_LOG_RECORDS
     config_dir = get_config_dir()
-    configs_file = config_dir / "saved_configs.json"
+    log_file = _config_log_path(config_dir)
+
+    # A cache built for a different directory (config-dir override
+    # changed mid-process) must not answer for this one.
+    if _CONFIG_CACHE_PATH is not None and _CONFIG_CACHE_PATH != log_file:
+        _invalidate_config_cache()
+
+    # One stat answers "does it exist", "is it empty" and "did it change";
+    # first-time users pay a single failed syscall and no JSON work.
+    try:
+        stat = log_file.stat()
+    except OSError:
+        legacy_file = _legacy_config_path(config_dir)
+        if not legacy_file.exists():
+            _invalidate_config_cache()
+            return {}
+        _migrate_legacy_configs(legacy_file, log_file)
+        try:
+            stat = log_file.stat()
+        except OSError:
+            _invalidate_config_cache()
+            return {}
+
+    mtime = stat.st_mtime
+    if _CONFIG_CACHE is not None and mtime == _CONFIG_CACHE_MTIME:
+        return _CONFIG_CACHE
 
-    if not configs_file.exists():
+    if stat.st_size == 0:
+        _CONFIG_CACHE = {}
+        _CONFIG_CACHE_MTIME = mtime
+        _CONFIG_CACHE_PATH = log_file
+        _CONFIG_LOG_RECORDS = 0
         return {}
 
     try:
-        with configs_file.open('r', encoding='utf-8') as f:
-            return json.load(f)
+        configs, records = _replay_config_log(log_file)
     except Exception:
         return {}
 
+    _CONFIG_CACHE = configs
+    _CONFIG_CACHE_MTIME = mtime
+    _CONFIG_CACHE_PATH = log_file
+    _CONFIG_LOG_RECORDS = records
+    return configs
+
+
+_CONFIG_NAMES: Optional[List[str]] = None
+_CONFIG_NAMES_MTIME: Optional[float] = None
+
 
 def list_config_names() -> List[str]:
     """List all saved configuration names."""
+    global _CONFIG_NAMES, _CONFIG_NAMES_MTIME
     configs = load_all_configs()
-    return sorted(configs.keys())
+    if _CONFIG_NAMES is None or _CONFIG_NAMES_MTIME != _CONFIG_CACHE_MTIME:
+        _CONFIG_NAMES = sorted(configs)
+        _CONFIG_NAMES_MTIME = _CONFIG_CACHE_MTIME
+    return _CONFIG_NAMES
 
 
 def load_config(name: str) -> Optional[Dict[str, Any]]:
     """Load a specific configuration by name."""
-    configs = load_all_configs()
-    config_entry = configs.get(name)
-    if config_entry:
-        return config_entry.get("config")
-    return None
+    if _CONFIG_CACHE is not None:
+        # A warm cache answers without touching the disk at all.
+        configs = load_all_configs()
+        config_entry = configs.get(name)
+        return config_entry.get("config") if config_entry else None
+
+    config_dir = get_config_dir()
+    log_file = _config_log_path(config_dir)
+    legacy_file = _legacy_config_path(config_dir)
+    if not log_file.exists() and legacy_file.exists():
+        _migrate_legacy_configs(legacy_file, log_file)
+
+    # Cold path: decode only the records that can mention this name instead
+    # of replaying every saved entry. Both ensure_ascii spellings of the
+    # quoted name are checked so the substring prefilter never skips a real
+    # match regardless of which encoder wrote the line.
+    needles = {
+        json.dumps(name).encode("utf-8"),
+        json.dumps(name, ensure_ascii=False).encode("utf-8"),
+    }
+    found: Optional[Dict[str, Any]] = None
+    try:
+        data = log_file.read_bytes()
+    except OSError:
+        return None
+    for line in data.splitlines():
+        if not any(needle in line for needle in needles):
+            continue
+        try:
+            record = _load_json_bytes(line)
+        except Exception:
+            continue
+        if record.get("name") != name:
+            continue
+        found = None if record.get("op") == "del" else record.get("config")
+    return found
 
 
 def delete_config(name: str) -> bool:
     """Delete a saved configuration by name."""
+    global _CONFIG_LOG_RECORDS
     config_dir = get_config_dir()
-    configs_file = config_dir / "saved_configs.json"
+    log_file = _config_log_path(config_dir)
 
-    if not configs_file.exists():
+    configs = dict(load_all_configs())
+    if name not in configs:
         return False
 
-    try:
-        # Load existing configs
-        with configs_file.open('r', encoding='utf-8') as f:
-            configs = json.load(f)
-
-        if name not in configs:
-            return False
-
-        # Remove the config
-        del configs[name]
+    del configs[name]
 
-        # Save back to file
-        with configs_file.open('w', encoding='utf-8') as f:
-            json.dump(configs, f, indent=2)
+    try:
+        with log_file.open("ab") as f:
+            f.write(_dump_json_line({"op": "del", "name": name}) + b"\n")
+        _CONFIG_LOG_RECORDS += 1
+        _store_config_cache(configs, log_file)
+        _maybe_compact_config_log(configs, log_file)
 
         print(f"Configuration deleted: {name}")
         return True
@@ -135,12 +413,16 @@ def delete_config(name: str) -> bool:
 def delete_all_configs() -> bool:
     """Delete all saved configurations."""
     config_dir = get_config_dir()
-    configs_file = config_dir / "saved_configs.json"
 
     try:
-        if configs_file.exists():
-            configs_file.unlink()
+        removed = False
+        for path in (_config_log_path(config_dir), _legacy_config_path(config_dir)):
+            if path.exists():
+                path.unlink()
+                removed = True
+        if removed:
             print("All configurations deleted.")
+        _invalidate_config_cache()
         return True
     except Exception as e:
         print(f"Failed to delete all configs: {e}")
@@ -191,7 +473,10 @@ def prompt_yes_no(prompt: str, default: bool = False) -> bool:
 
 def offer_existing_configs() -> Optional[Dict[str, Any]]:
     """Offer to use existing configurations."""
-    configs = list_config_names()
+    # One snapshot serves both the listing and the selected entry, instead of
+    # a list pass followed by a second full load for the chosen name.
+    all_configs = load_all_configs()
+    configs = sorted(all_configs)
 
     if not configs:
         return None
@@ -211,7 +496,7 @@ def offer_existing_configs() -> Optional[Dict[str, Any]]:
             if 1 <= choice_num <= len(configs):
                 # User selected existing config
                 selected_config = configs[choice_num - 1]
-                config = load_config(selected_config)
+                config = (all_configs.get(selected_config) or {}).get("config")
                 if config:
                     print(f"\nUsing configuration: {selected_config}")
                     display_config_summary(config)
@@ -262,16 +547,7 @@ def manage_configs_menu() -> bool:
         all_configs = load_all_configs()
         for i, config_name in enumerate(configs, 1):
             config_entry = all_configs.get(config_name, {})
-            saved_at = config_entry.get("saved_at", "Unknown")
-            if saved_at != "Unknown":
-                # Format the timestamp nicely
-                try:
-                    from datetime import datetime
-                    dt = datetime.fromisoformat(saved_at)
-                    saved_at = dt.strftime("%Y-%m-%d %H:%M")
-                except:
-                    pass
-
+            saved_at = _format_saved_at(config_entry.get("saved_at"))
             print(f"  {i}. {config_name} (saved: {saved_at})")
 
         print(f"\n  v. View configuration details")
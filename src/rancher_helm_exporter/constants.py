@@ -1,7 +1,7 @@
 """Constants for Kubernetes field names and configuration values."""
 from __future__ import annotations
 
-from typing import Final, Sequence
+from typing import Final, FrozenSet, Sequence
 
 # Kubernetes API field names
 class K8sFields:
@@ -142,7 +142,7 @@ SUPPORTING_RESOURCES: Final[Sequence[str]] = (
 )
 
 # Fields to remove from metadata during cleaning
-METADATA_FIELDS_TO_DROP: Final[Sequence[str]] = (
+METADATA_FIELDS_TO_DROP: Final[FrozenSet[str]] = frozenset((
     K8sFields.CREATION_TIMESTAMP,
     K8sFields.DELETION_GRACE_PERIOD,
     K8sFields.DELETION_TIMESTAMP,
@@ -153,7 +153,7 @@ METADATA_FIELDS_TO_DROP: Final[Sequence[str]] = (
     K8sFields.RESOURCE_VERSION,
     K8sFields.SELF_LINK,
     K8sFields.UID,
-)
+))
 
 # Secret types to skip by default
 DEFAULT_SECRET_TYPES_TO_SKIP: Final[Sequence[str]] = (
@@ -170,13 +170,13 @@ KUBECTL_ANNOTATION_SUFFIXES: Final[Sequence[str]] = (
 )
 
 # Service fields to clean
-SERVICE_FIELDS_TO_CLEAN: Final[Sequence[str]] = (
+SERVICE_FIELDS_TO_CLEAN: Final[FrozenSet[str]] = frozenset((
     K8sFields.CLUSTER_IP,
     K8sFields.CLUSTER_IPS,
     K8sFields.IP_FAMILIES,
     K8sFields.IP_FAMILY_POLICY,
     K8sFields.SESSION_AFFINITY_CONFIG,
-)
+))
 
 # Pod controller fields to clean
 POD_CONTROLLER_FIELDS_TO_CLEAN: Final[Sequence[str]] = (
@@ -185,22 +185,22 @@ POD_CONTROLLER_FIELDS_TO_CLEAN: Final[Sequence[str]] = (
 )
 
 # PVC fields to clean
-PVC_FIELDS_TO_CLEAN: Final[Sequence[str]] = (
+PVC_FIELDS_TO_CLEAN: Final[FrozenSet[str]] = frozenset((
     K8sFields.VOLUME_NAME,
     K8sFields.DATA_SOURCE,
     K8sFields.DATA_SOURCE_REF,
-)
+))
 
 # PVC annotations to remove
-PVC_ANNOTATIONS_TO_REMOVE: Final[Sequence[str]] = (
+PVC_ANNOTATIONS_TO_REMOVE: Final[FrozenSet[str]] = frozenset((
     "pv.kubernetes.io/bind-completed",
     "pv.kubernetes.io/bound-by-controller",
-)
+))
 
 # Special labels to remove
-SPECIAL_LABELS_TO_REMOVE: Final[Sequence[str]] = (
+SPECIAL_LABELS_TO_REMOVE: Final[FrozenSet[str]] = frozenset((
     "pod-template-hash",
-)
+))
 
 # Default values
 DEFAULT_CHART_VERSION: Final[str] = "0.1.0"
@@ -472,7 +472,31 @@ class HelmChartExporter:
             namespace=self.config.namespace,
             selector=self.config.selector,
         )
-    
+
+    def list_resource_items_batch(self, resource_types: List[str]) -> Dict[str, K8sObjectList]:
+        """
+        List several resource types with one kubectl call - for interactive mode.
+
+        Args:
+            resource_types: Types of resources to list
+
+        Returns:
+            Dictionary mapping each resource type to its resources
+        """
+        try:
+            return self.kubectl_client.list_resources_grouped(
+                resource_types,
+                namespace=self.config.namespace,
+                selector=self.config.selector,
+            )
+        except Exception:
+            # Mixed-type queries fail as a whole if any single type is
+            # unavailable; fall back to the per-type calls in that case.
+            return {
+                resource_type: self.list_resource_items(resource_type)
+                for resource_type in resource_types
+            }
+
     def ensure_required_binaries(self) -> None:
         """Ensure required binaries are available - for compatibility."""
         self._validate_prerequisites()
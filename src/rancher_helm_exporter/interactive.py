@@ -26,8 +26,21 @@ if sys.platform == "win32":
 
 else:
     import curses
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, Iterator, List, MutableMapping, Optional, Sequence, Set, Tuple
+from typing import (
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 
 @dataclass
@@ -55,7 +68,9 @@ class SelectionPlan:
 def build_interactive_plan(exporter: "_ResourceLister") -> SelectionPlan:
     """Capture the operator's desired resources via an interactive checklist."""
 
+    exporter = _CachedLister(exporter)
     workload_resources = ("deployments", "statefulsets", "daemonsets", "cronjobs", "jobs")
+    exporter.prefetch(workload_resources)
     workloads_by_resource: Dict[str, Dict[str, MutableMapping[str, object]]] = {}
     for resource in workload_resources:
         manifests = exporter.list_resource_items(resource)
@@ -70,10 +85,32 @@ def build_interactive_plan(exporter: "_ResourceLister") -> SelectionPlan:
     if not workloads_by_resource:
         raise SystemExit("No workloads were found in the namespace. Nothing to export.")
 
-    selected_workloads = _ask_workloads(workloads_by_resource)
+    # One curses session covers every prompt; init/endwin cycles between
+    # prompts cost tens of milliseconds each and flash the terminal.
+    return curses.wrapper(_interactive_session, exporter, workloads_by_resource)
+
+
+def _interactive_session(
+    stdscr: "curses._CursesWindow",
+    exporter: "_CachedLister",
+    workloads_by_resource: Dict[str, Dict[str, MutableMapping[str, object]]],
+) -> SelectionPlan:
+    selected_workloads = _ask_workloads(stdscr, workloads_by_resource)
     if not selected_workloads:
         raise SystemExit("No workloads selected. Aborting interactive session.")
 
+    # Only fetch supporting resources once a workload selection exists; the
+    # listings overlap with the operator reading the next prompt.
+    supporting_resources = (
+        "configmaps",
+        "secrets",
+        "serviceaccounts",
+        "persistentvolumeclaims",
+        "services",
+        "ingresses",
+    )
+    exporter.prefetch(supporting_resources)
+
     plan = SelectionPlan()
     selected_workload_manifests: List[MutableMapping[str, object]] = []
     for resource, name in selected_workloads:
@@ -81,79 +118,84 @@ def build_interactive_plan(exporter: "_ResourceLister") -> SelectionPlan:
         plan.add(resource, [name])
         selected_workload_manifests.append(manifest)
 
-    configmap_items = exporter.list_resource_items("configmaps")
-    configmap_names = _manifest_names(configmap_items)
-    default_configmaps = sorted(
-        _collect_configmaps(selected_workload_manifests).intersection(configmap_names)
+    configmap_refs, secret_refs, service_account_refs, pvc_refs = _collect_workload_refs(
+        selected_workload_manifests
     )
+
+    # Each listing is walked exactly once here; every later consumer works off
+    # the name-keyed index (sorted keys for prompts, O(1) manifest lookups).
+    index_by_resource = {
+        resource: _manifest_index(exporter.list_resource_items(resource))
+        for resource in supporting_resources
+    }
+
+    configmap_names = sorted(index_by_resource["configmaps"])
+    default_configmaps = _default_names(configmap_refs, index_by_resource["configmaps"])
     chosen_configmaps = _ask_multiple(
+        stdscr,
         "Select ConfigMaps to include",
         configmap_names,
         default=default_configmaps,
     )
     plan.add("configmaps", chosen_configmaps)
 
-    secret_items = exporter.list_resource_items("secrets")
-    secret_names = _manifest_names(secret_items)
-    default_secrets = sorted(
-        _collect_secrets(selected_workload_manifests).intersection(secret_names)
-    )
+    secret_names = sorted(index_by_resource["secrets"])
+    default_secrets = _default_names(secret_refs, index_by_resource["secrets"])
     chosen_secrets = _ask_multiple(
+        stdscr,
         "Select Secrets to include",
         secret_names,
         default=default_secrets,
     )
     plan.add("secrets", chosen_secrets)
 
-    service_account_items = exporter.list_resource_items("serviceaccounts")
-    service_account_names = _manifest_names(service_account_items)
-    default_service_accounts = sorted(
-        _collect_service_accounts(selected_workload_manifests).intersection(
-            service_account_names
-        )
+    service_account_names = sorted(index_by_resource["serviceaccounts"])
+    default_service_accounts = _default_names(
+        service_account_refs, index_by_resource["serviceaccounts"]
     )
     chosen_service_accounts = _ask_multiple(
+        stdscr,
         "Select ServiceAccounts to include",
         service_account_names,
         default=default_service_accounts,
     )
     plan.add("serviceaccounts", chosen_service_accounts)
 
-    pvc_items = exporter.list_resource_items("persistentvolumeclaims")
-    pvc_names = _manifest_names(pvc_items)
-    default_pvcs = sorted(
-        _collect_persistent_volume_claims(selected_workload_manifests).intersection(
-            pvc_names
-        )
+    pvc_names = sorted(index_by_resource["persistentvolumeclaims"])
+    default_pvcs = _default_names(
+        pvc_refs, index_by_resource["persistentvolumeclaims"]
     )
     chosen_pvcs = _ask_multiple(
+        stdscr,
         "Select PersistentVolumeClaims to include",
         pvc_names,
         default=default_pvcs,
     )
     plan.add("persistentvolumeclaims", chosen_pvcs)
 
-    service_items = exporter.list_resource_items("services")
-    service_names = _manifest_names(service_items)
+    service_index = index_by_resource["services"]
+    service_names = sorted(service_index)
     default_services = sorted(
-        _services_matching_workloads(selected_workload_manifests, service_items)
+        _services_matching_workloads(selected_workload_manifests, service_index.values())
     )
     chosen_services = _ask_multiple(
+        stdscr,
         "Select Services to include",
         service_names,
         default=default_services,
     )
     plan.add("services", chosen_services)
 
-    ingress_items = exporter.list_resource_items("ingresses")
-    ingress_names = _manifest_names(ingress_items)
+    ingress_index = index_by_resource["ingresses"]
+    ingress_names = sorted(ingress_index)
     default_ingresses = sorted(
         _ingresses_for_services(
-            ingress_items,
+            ingress_index.values(),
             set(chosen_services) if chosen_services else set(default_services),
-        ).intersection(ingress_names)
+        )
     )
     chosen_ingresses = _ask_multiple(
+        stdscr,
         "Select Ingresses to include",
         ingress_names,
         default=default_ingresses,
@@ -163,6 +205,35 @@ def build_interactive_plan(exporter: "_ResourceLister") -> SelectionPlan:
     return plan
 
 
+# Hot manifest keys, interned once so the collector's dict probes hit the
+# pointer-equality fast path even for parsers that do not intern their keys.
+_K_NAME = sys.intern("name")
+_K_VOLUMES = sys.intern("volumes")
+_K_CONFIG_MAP = sys.intern("configMap")
+_K_SECRET = sys.intern("secret")
+_K_SECRET_NAME = sys.intern("secretName")
+_K_PROJECTED = sys.intern("projected")
+_K_SOURCES = sys.intern("sources")
+_K_IMAGE_PULL_SECRETS = sys.intern("imagePullSecrets")
+_K_ENV = sys.intern("env")
+_K_ENV_FROM = sys.intern("envFrom")
+_K_VALUE_FROM = sys.intern("valueFrom")
+_K_CONFIG_MAP_REF = sys.intern("configMapRef")
+_K_SECRET_REF = sys.intern("secretRef")
+_K_CONFIG_MAP_KEY_REF = sys.intern("configMapKeyRef")
+_K_SECRET_KEY_REF = sys.intern("secretKeyRef")
+_K_SERVICE_ACCOUNT_NAME = sys.intern("serviceAccountName")
+_K_SERVICE_ACCOUNT = sys.intern("serviceAccount")
+_K_PERSISTENT_VOLUME_CLAIM = sys.intern("persistentVolumeClaim")
+_K_CLAIM_NAME = sys.intern("claimName")
+
+
+def _is_map(value: object) -> bool:
+    # kubectl output is parsed JSON, so every mapping node is a plain dict;
+    # test that with a pointer comparison before falling back to the ABC.
+    return type(value) is dict or isinstance(value, MutableMapping)
+
+
 class _ResourceLister:
     """Protocol-like helper to satisfy type-checkers."""
 
@@ -170,90 +241,197 @@ class _ResourceLister:
         raise NotImplementedError
 
 
+class _CachedLister:
+    """Memoizing wrapper so each resource listing hits the cluster at most once."""
+
+    def __init__(self, exporter: "_ResourceLister") -> None:
+        self._exporter = exporter
+        self._cache: Dict[str, List[MutableMapping[str, object]]] = {}
+        self._pending: Dict[str, "Future[List[MutableMapping[str, object]]]"] = {}
+
+    def prefetch(self, resources: Sequence[str]) -> None:
+        """Kick off all listings in one batched call so prompts never wait on the API."""
+        missing = [
+            resource
+            for resource in resources
+            if resource not in self._cache and resource not in self._pending
+        ]
+        if not missing:
+            return
+        executor = ThreadPoolExecutor(max_workers=8)
+        try:
+            batch = getattr(self._exporter, "list_resource_items_batch", None)
+            if batch is not None:
+                # One kubectl round-trip for the whole group; the per-resource
+                # futures just pick their slice out of the shared result.
+                group = executor.submit(batch, list(missing))
+                for resource in missing:
+                    self._pending[resource] = executor.submit(
+                        lambda res=resource: group.result().get(res, [])
+                    )
+            else:
+                for resource in missing:
+                    self._pending[resource] = executor.submit(
+                        self._exporter.list_resource_items, resource
+                    )
+        finally:
+            executor.shutdown(wait=False)
+
+    def list_resource_items(self, resource: str) -> List[MutableMapping[str, object]]:
+        if resource not in self._cache:
+            future = self._pending.pop(resource, None)
+            if future is not None:
+                self._cache[resource] = future.result()
+            else:
+                self._cache[resource] = self._exporter.list_resource_items(resource)
+        return self._cache[resource]
+
+
 @dataclass
 class _Option:
     label: str
-    value: str
+    value: Hashable
 
 
 class _CheckboxPrompt:
+    _DISPATCH: "Dict[int, Callable[[_CheckboxPrompt, int], None]]" = {}
+
     def __init__(
         self,
         title: str,
         options: Sequence[_Option],
         *,
-        default: Optional[Sequence[str]] = None,
+        default: Optional[Sequence[Hashable]] = None,
         minimum: int = 0,
     ) -> None:
         self.title = title
         self.options = list(options)
         self.minimum = max(0, int(minimum))
         default_values = {value for value in (default or []) if value is not None}
-        self.selected = {option.value: option.value in default_values for option in self.options}
+        self.selected: Set[Hashable] = {
+            option.value for option in self.options if option.value in default_values
+        }
+        self._selected_count = len(self.selected)
         self.cursor = 0
         self.offset = 0
         self.message: Optional[str] = None
+        self._label_cache: Dict[Tuple[int, int, bool], str] = {}
+        self._full_redraw = True
+        self._dirty: Set[int] = set()
+        self._footer_dirty = False
 
     # Public API ---------------------------------------------------------
-    def run(self, stdscr: "curses._CursesWindow") -> List[str]:
+    def run(self, stdscr: "curses._CursesWindow") -> List[Hashable]:
         curses.use_default_colors()
         stdscr.keypad(True)
+        stdscr.leaveok(True)
         try:
             curses.curs_set(0)
         except curses.error:  # pragma: no cover - depends on terminal capabilities
             pass
 
+        self._full_redraw = True
+        self._dirty.clear()
+        self._footer_dirty = False
         while True:
-            stdscr.erase()
             max_y, max_x = stdscr.getmaxyx()
-            self._render_header(stdscr, max_x)
             start_line = self._header_height()
             visible_count = max(1, max_y - start_line - 1)
+            previous_offset = self.offset
             self._adjust_offset(visible_count)
-            self._render_options(stdscr, max_x, start_line, visible_count)
-            _addstr(
-                stdscr,
-                start_line + visible_count,
-                0,
-                self._footer_text(),
-                curses.A_DIM,
+            if self.offset != previous_offset:
+                self._full_redraw = True
+
+            if self._full_redraw:
+                stdscr.erase()
+                self._render_header(stdscr, max_x)
+                self._render_options(stdscr, max_x, start_line, visible_count)
+                self._footer_dirty = True
+            elif self._dirty:
+                for index in self._dirty:
+                    if self.offset <= index < self.offset + visible_count:
+                        self._render_option_row(stdscr, max_x, start_line, index)
+            self._dirty.clear()
+            if self._footer_dirty:
+                self._render_footer(stdscr, max_x, start_line + visible_count)
+            self._full_redraw = False
+            self._footer_dirty = False
+            stdscr.noutrefresh()
+            curses.doupdate()
+
+            getch = stdscr.getch
+            selected = self._apply_key(getch(), visible_count)
+            if selected is not None:
+                return selected
+            # Drain whatever key-repeat already queued so a held arrow key
+            # advances many steps per rendered frame instead of one.
+            stdscr.nodelay(True)
+            try:
+                while (key := getch()) != -1:
+                    selected = self._apply_key(key, visible_count)
+                    if selected is not None:
+                        return selected
+            finally:
+                stdscr.nodelay(False)
+
+    # Input handling -----------------------------------------------------
+    def _apply_key(self, key: int, visible_count: int) -> Optional[List[Hashable]]:
+        """Apply one keystroke; return the selection when the prompt is done."""
+        previous_message = self.message
+        handler = self._DISPATCH.get(key)
+        if handler is not None:
+            handler(self, visible_count)
+            self.message = None
+        elif key in (curses.KEY_ENTER, 10, 13):
+            selected = self._selected_values()
+            if len(selected) >= self.minimum:
+                return selected
+            self.message = (
+                "Select at least one option."
+                if self.minimum <= 1
+                else f"Select at least {self.minimum} options."
             )
-            stdscr.refresh()
-
-            key = stdscr.getch()
-            if key in (curses.KEY_UP, ord("k")):
-                self.cursor = (self.cursor - 1) % len(self.options)
-                self.message = None
-            elif key in (curses.KEY_DOWN, ord("j")):
-                self.cursor = (self.cursor + 1) % len(self.options)
-                self.message = None
-            elif key in (curses.KEY_PPAGE,):
-                self.cursor = max(self.cursor - visible_count, 0)
-                self.message = None
-            elif key in (curses.KEY_NPAGE,):
-                self.cursor = min(self.cursor + visible_count, len(self.options) - 1)
-                self.message = None
-            elif key == ord(" "):
-                self._toggle_current()
-                self.message = None
-            elif key in (ord("a"), ord("A")):
-                self._toggle_all()
-                self.message = None
-            elif key in (curses.KEY_ENTER, 10, 13):
-                selected = self._selected_values()
-                if len(selected) >= self.minimum:
-                    return selected
-                self.message = (
-                    "Select at least one option."
-                    if self.minimum <= 1
-                    else f"Select at least {self.minimum} options."
-                )
-            elif key in (ord("q"), ord("Q"), 27):
-                raise SystemExit("Interactive session aborted by user.")
-            elif key == curses.KEY_RESIZE:  # pragma: no cover - terminal specific
-                pass
-            else:  # Ignore all other keys
-                self.message = None
+        elif key in (ord("q"), ord("Q"), 27):
+            raise SystemExit("Interactive session aborted by user.")
+        elif key == curses.KEY_RESIZE:  # pragma: no cover - terminal specific
+            self._label_cache.clear()
+            self._full_redraw = True
+        else:  # Ignore all other keys
+            self.message = None
+        if self.message != previous_message:
+            # The header grows or shrinks with the message line, so the
+            # whole layout shifts and a partial redraw would misplace rows.
+            self._full_redraw = True
+        return None
+
+    def _key_up(self, visible_count: int) -> None:
+        self._dirty.add(self.cursor)
+        self.cursor = (self.cursor - 1) % len(self.options)
+        self._dirty.add(self.cursor)
+
+    def _key_down(self, visible_count: int) -> None:
+        self._dirty.add(self.cursor)
+        self.cursor = (self.cursor + 1) % len(self.options)
+        self._dirty.add(self.cursor)
+
+    def _key_page_up(self, visible_count: int) -> None:
+        self._dirty.add(self.cursor)
+        self.cursor = max(self.cursor - visible_count, 0)
+        self._dirty.add(self.cursor)
+
+    def _key_page_down(self, visible_count: int) -> None:
+        self._dirty.add(self.cursor)
+        self.cursor = min(self.cursor + visible_count, len(self.options) - 1)
+        self._dirty.add(self.cursor)
+
+    def _key_toggle(self, visible_count: int) -> None:
+        self._toggle_current()
+        self._dirty.add(self.cursor)
+        self._footer_dirty = True
+
+    def _key_toggle_all(self, visible_count: int) -> None:
+        self._toggle_all()
+        self._full_redraw = True
 
     # Rendering helpers --------------------------------------------------
     def _render_header(self, stdscr: "curses._CursesWindow", max_x: int) -> None:
@@ -275,23 +453,42 @@ class _CheckboxPrompt:
         visible_count: int,
     ) -> None:
         end_index = min(self.offset + visible_count, len(self.options))
-        for visual_index, option_index in enumerate(range(self.offset, end_index)):
-            option = self.options[option_index]
-            marker = "[x]" if self.selected.get(option.value) else "[ ]"
-            text = f"{marker} {option.label}"
-            attr = curses.A_REVERSE if option_index == self.cursor else curses.A_NORMAL
-            _addstr(
-                stdscr,
-                start_line + visual_index,
-                0,
-                _truncate(text, max_x - 1),
-                attr,
-            )
+        for option_index in range(self.offset, end_index):
+            self._render_option_row(stdscr, max_x, start_line, option_index)
+
+    def _render_option_row(
+        self,
+        stdscr: "curses._CursesWindow",
+        max_x: int,
+        start_line: int,
+        option_index: int,
+    ) -> None:
+        option = self.options[option_index]
+        selected = option.value in self.selected
+        cache_key = (option_index, max_x, selected)
+        text = self._label_cache.get(cache_key)
+        if text is None:
+            marker = "[x]" if selected else "[ ]"
+            text = _truncate(f"{marker} {option.label}", max_x - 1)
+            self._label_cache[cache_key] = text
+        attr = curses.A_REVERSE if option_index == self.cursor else curses.A_NORMAL
+        _addstr(
+            stdscr,
+            start_line + (option_index - self.offset),
+            0,
+            text,
+            attr,
+        )
+
+    def _render_footer(self, stdscr: "curses._CursesWindow", max_x: int, line: int) -> None:
+        # Pad to the full width so a shrinking selection count does not leave
+        # stale characters behind when the row is overwritten in place.
+        text = _truncate(self._footer_text(), max_x - 1).ljust(max(0, max_x - 1))
+        _addstr(stdscr, line, 0, text, curses.A_DIM)
 
     def _footer_text(self) -> str:
-        selected_count = len(self._selected_values())
         total = len(self.options)
-        return f"Selected {selected_count}/{total}. Press q to cancel."
+        return f"Selected {self._selected_count}/{total}. Press q to cancel."
 
     def _adjust_offset(self, visible_count: int) -> None:
         if self.cursor < self.offset:
@@ -300,36 +497,55 @@ class _CheckboxPrompt:
             self.offset = self.cursor - visible_count + 1
 
     def _toggle_current(self) -> None:
-        option = self.options[self.cursor]
-        self.selected[option.value] = not self.selected.get(option.value, False)
+        value = self.options[self.cursor].value
+        if value in self.selected:
+            self.selected.discard(value)
+            self._selected_count -= 1
+        else:
+            self.selected.add(value)
+            self._selected_count += 1
 
     def _toggle_all(self) -> None:
-        values = list(self.selected)
-        should_select = not all(self.selected[value] for value in values)
-        for value in values:
-            self.selected[value] = should_select
+        values = {option.value for option in self.options}
+        self.selected = set() if self.selected >= values else values
+        self._selected_count = len(self.selected)
+
+    def _selected_values(self) -> List[Hashable]:
+        return [option.value for option in self.options if option.value in self.selected]
+
 
-    def _selected_values(self) -> List[str]:
-        return [option.value for option in self.options if self.selected.get(option.value)]
+if sys.platform != "win32":
+    # Hash dispatch instead of scanning `key in (...)` tuples per keystroke.
+    _CheckboxPrompt._DISPATCH = {
+        curses.KEY_UP: _CheckboxPrompt._key_up,
+        ord("k"): _CheckboxPrompt._key_up,
+        curses.KEY_DOWN: _CheckboxPrompt._key_down,
+        ord("j"): _CheckboxPrompt._key_down,
+        curses.KEY_PPAGE: _CheckboxPrompt._key_page_up,
+        curses.KEY_NPAGE: _CheckboxPrompt._key_page_down,
+        ord(" "): _CheckboxPrompt._key_toggle,
+        ord("a"): _CheckboxPrompt._key_toggle_all,
+        ord("A"): _CheckboxPrompt._key_toggle_all,
+    }
 
 
 def _ask_workloads(
-    workloads: Dict[str, Dict[str, MutableMapping[str, object]]]
+    stdscr: "curses._CursesWindow",
+    workloads: Dict[str, Dict[str, MutableMapping[str, object]]],
 ) -> List[Tuple[str, str]]:
     options: List[_Option] = []
-    value_map: Dict[str, Tuple[str, str]] = {}
     for resource in sorted(workloads):
-        for name, manifest in sorted(workloads[resource].items()):
-            label = _format_workload_label(resource, manifest)
-            value = f"{resource}:{name}"
-            value_map[value] = (resource, name)
-            options.append(_Option(label=label, value=value))
+        # kubectl listings arrive name-sorted, and the name-keyed dicts keep
+        # insertion order, so the items need no re-sort here.
+        for name, manifest in workloads[resource].items():
+            label = _format_workload_label(resource, name, manifest)
+            options.append(_Option(label=label, value=(resource, name)))
     prompt = _CheckboxPrompt("Select workloads to export", options, minimum=1)
-    chosen_values = _run_prompt(prompt)
-    return [value_map[value] for value in chosen_values if value in value_map]
+    return list(prompt.run(stdscr))
 
 
 def _ask_multiple(
+    stdscr: "curses._CursesWindow",
     title: str,
     options: Sequence[str],
     *,
@@ -337,13 +553,10 @@ def _ask_multiple(
 ) -> List[str]:
     if not options:
         return []
-    option_objects = [_Option(label=option, value=option) for option in sorted(options)]
+    # Callers pass sorted manifest-index keys, so no re-sort is needed here.
+    option_objects = [_Option(label=option, value=option) for option in options]
     prompt = _CheckboxPrompt(title, option_objects, default=default or [])
-    return _run_prompt(prompt)
-
-
-def _run_prompt(prompt: _CheckboxPrompt) -> List[str]:
-    return curses.wrapper(prompt.run)
+    return prompt.run(stdscr)
 
 
 def _truncate(text: str, width: int) -> str:
@@ -365,133 +578,147 @@ def _addstr(stdscr: "curses._CursesWindow", y: int, x: int, text: str, attr: int
 
 def _manifest_name(manifest: MutableMapping[str, object]) -> str:
     metadata = manifest.get("metadata")
-    if isinstance(metadata, MutableMapping):
+    if _is_map(metadata):
         name = metadata.get("name")
         if isinstance(name, str):
             return name
     return ""
 
 
-def _manifest_names(items: Sequence[MutableMapping[str, object]]) -> List[str]:
-    names = {_manifest_name(item) for item in items}
-    names.discard("")
-    return sorted(names)
+def _default_names(
+    refs: Set[str], index: Dict[str, MutableMapping[str, object]]
+) -> List[str]:
+    """Keep referenced names that exist, scanning the small reference set."""
+    return sorted(name for name in refs if name in index)
+
+
+def _manifest_index(
+    items: Sequence[MutableMapping[str, object]]
+) -> Dict[str, MutableMapping[str, object]]:
+    """Key manifests by name so later consumers avoid re-walking the listing."""
+    return {name: item for item in items if (name := _manifest_name(item))}
 
 
 def _replica_count(manifest: MutableMapping[str, object]) -> int:
     spec = manifest.get("spec")
-    if isinstance(spec, MutableMapping):
+    if _is_map(spec):
         replicas = spec.get("replicas")
         if isinstance(replicas, int):
             return replicas
     return 1
 
 
-def _collect_configmaps(deployments: Sequence[MutableMapping[str, object]]) -> Set[str]:
-    names: Set[str] = set()
+def _collect_workload_refs(
+    deployments: Sequence[MutableMapping[str, object]]
+) -> Tuple[Set[str], Set[str], Set[str], Set[str]]:
+    """Gather every referenced supporting-resource name in one walk per workload.
+
+    Returns the referenced ConfigMap, Secret, ServiceAccount and
+    PersistentVolumeClaim names; fusing the four collectors means the pod
+    spec, volume list and container list are each visited exactly once.
+    """
+
+    configmaps: Set[str] = set()
+    secrets: Set[str] = set()
+    service_accounts: Set[str] = set()
+    claims: Set[str] = set()
+    # The loop below is the hottest pure-Python scan in this module; bind the
+    # attribute lookups it repeats thousands of times to locals once.
+    configmaps_add = configmaps.add
+    secrets_add = secrets.add
+    claims_add = claims.add
+    is_map = _is_map
     for manifest in deployments:
         pod_spec = _pod_spec(manifest)
-        volumes = pod_spec.get("volumes")
+        service_account = pod_spec.get(_K_SERVICE_ACCOUNT_NAME) or pod_spec.get(
+            _K_SERVICE_ACCOUNT
+        )
+        if isinstance(service_account, str) and service_account:
+            service_accounts.add(service_account)
+        volumes = pod_spec.get(_K_VOLUMES)
         if isinstance(volumes, list):
             for volume in volumes:
-                if isinstance(volume, MutableMapping):
-                    config_map = volume.get("configMap")
-                    if isinstance(config_map, MutableMapping):
-                        name = config_map.get("name")
-                        if isinstance(name, str):
-                            names.add(name)
-                    projected = volume.get("projected")
-                    if isinstance(projected, MutableMapping):
-                        sources = projected.get("sources")
-                        if isinstance(sources, list):
-                            for source in sources:
-                                if isinstance(source, MutableMapping):
-                                    ref = source.get("configMap")
-                                    if isinstance(ref, MutableMapping):
-                                        name = ref.get("name")
-                                        if isinstance(name, str):
-                                            names.add(name)
-        for container in _containers_from_spec(pod_spec):
-            env_from = container.get("envFrom")
-            if isinstance(env_from, list):
-                for entry in env_from:
-                    if isinstance(entry, MutableMapping):
-                        ref = entry.get("configMapRef")
-                        if isinstance(ref, MutableMapping):
-                            name = ref.get("name")
-                            if isinstance(name, str):
-                                names.add(name)
-            env = container.get("env")
-            if isinstance(env, list):
-                for entry in env:
-                    if isinstance(entry, MutableMapping):
-                        value_from = entry.get("valueFrom")
-                        if isinstance(value_from, MutableMapping):
-                            config_ref = value_from.get("configMapKeyRef")
-                            if isinstance(config_ref, MutableMapping):
-                                name = config_ref.get("name")
+                if not is_map(volume):
+                    continue
+                config_map = volume.get(_K_CONFIG_MAP)
+                if is_map(config_map):
+                    name = config_map.get(_K_NAME)
+                    if isinstance(name, str):
+                        configmaps_add(name)
+                secret = volume.get(_K_SECRET)
+                if is_map(secret):
+                    name = secret.get(_K_SECRET_NAME) or secret.get(_K_NAME)
+                    if isinstance(name, str):
+                        secrets_add(name)
+                claim = volume.get(_K_PERSISTENT_VOLUME_CLAIM)
+                if is_map(claim):
+                    name = claim.get(_K_CLAIM_NAME) or claim.get(_K_NAME)
+                    if isinstance(name, str) and name:
+                        claims_add(name)
+                projected = volume.get(_K_PROJECTED)
+                if is_map(projected):
+                    sources = projected.get(_K_SOURCES)
+                    if isinstance(sources, list):
+                        for source in sources:
+                            if not is_map(source):
+                                continue
+                            ref = source.get(_K_CONFIG_MAP)
+                            if is_map(ref):
+                                name = ref.get(_K_NAME)
                                 if isinstance(name, str):
-                                    names.add(name)
-    return names
-
-
-def _collect_secrets(deployments: Sequence[MutableMapping[str, object]]) -> Set[str]:
-    names: Set[str] = set()
-    for manifest in deployments:
-        pod_spec = _pod_spec(manifest)
-        volumes = pod_spec.get("volumes")
-        if isinstance(volumes, list):
-            for volume in volumes:
-                if isinstance(volume, MutableMapping):
-                    secret = volume.get("secret")
-                    if isinstance(secret, MutableMapping):
-                        name = secret.get("secretName") or secret.get("name")
-                        if isinstance(name, str):
-                            names.add(name)
-                    projected = volume.get("projected")
-                    if isinstance(projected, MutableMapping):
-                        sources = projected.get("sources")
-                        if isinstance(sources, list):
-                            for source in sources:
-                                if isinstance(source, MutableMapping):
-                                    ref = source.get("secret")
-                                    if isinstance(ref, MutableMapping):
-                                        name = ref.get("name")
-                                        if isinstance(name, str):
-                                            names.add(name)
-        image_pull_secrets = pod_spec.get("imagePullSecrets")
+                                    configmaps_add(name)
+                            ref = source.get(_K_SECRET)
+                            if is_map(ref):
+                                name = ref.get(_K_NAME)
+                                if isinstance(name, str):
+                                    secrets_add(name)
+        image_pull_secrets = pod_spec.get(_K_IMAGE_PULL_SECRETS)
         if isinstance(image_pull_secrets, list):
             for pull_secret in image_pull_secrets:
-                if isinstance(pull_secret, MutableMapping):
-                    name = pull_secret.get("name")
+                if is_map(pull_secret):
+                    name = pull_secret.get(_K_NAME)
                     if isinstance(name, str):
-                        names.add(name)
+                        secrets_add(name)
         for container in _containers_from_spec(pod_spec):
-            env_from = container.get("envFrom")
+            env_from = container.get(_K_ENV_FROM)
             if isinstance(env_from, list):
                 for entry in env_from:
-                    if isinstance(entry, MutableMapping):
-                        ref = entry.get("secretRef")
-                        if isinstance(ref, MutableMapping):
-                            name = ref.get("name")
-                            if isinstance(name, str):
-                                names.add(name)
-            env = container.get("env")
+                    if not is_map(entry):
+                        continue
+                    ref = entry.get(_K_CONFIG_MAP_REF)
+                    if is_map(ref):
+                        name = ref.get(_K_NAME)
+                        if isinstance(name, str):
+                            configmaps_add(name)
+                    ref = entry.get(_K_SECRET_REF)
+                    if is_map(ref):
+                        name = ref.get(_K_NAME)
+                        if isinstance(name, str):
+                            secrets_add(name)
+            env = container.get(_K_ENV)
             if isinstance(env, list):
                 for entry in env:
-                    if isinstance(entry, MutableMapping):
-                        value_from = entry.get("valueFrom")
-                        if isinstance(value_from, MutableMapping):
-                            secret_ref = value_from.get("secretKeyRef")
-                            if isinstance(secret_ref, MutableMapping):
-                                name = secret_ref.get("name")
-                                if isinstance(name, str):
-                                    names.add(name)
-    return names
+                    if not is_map(entry):
+                        continue
+                    value_from = entry.get(_K_VALUE_FROM)
+                    if not is_map(value_from):
+                        continue
+                    ref = value_from.get(_K_CONFIG_MAP_KEY_REF)
+                    if is_map(ref):
+                        name = ref.get(_K_NAME)
+                        if isinstance(name, str):
+                            configmaps_add(name)
+                    ref = value_from.get(_K_SECRET_KEY_REF)
+                    if is_map(ref):
+                        name = ref.get(_K_NAME)
+                        if isinstance(name, str):
+                            secrets_add(name)
+    return configmaps, secrets, service_accounts, claims
 
 
-def _format_workload_label(resource: str, manifest: MutableMapping[str, object]) -> str:
-    name = _manifest_name(manifest) or "<unknown>"
+def _format_workload_label(
+    resource: str, name: str, manifest: MutableMapping[str, object]
+) -> str:
     kind = manifest.get("kind")
     if not isinstance(kind, str):
         kind = resource.rstrip("s").title()
@@ -502,13 +729,13 @@ def _format_workload_label(resource: str, manifest: MutableMapping[str, object])
         details.append(f"{replicas} replica{'s' if replicas != 1 else ''}")
     elif resource == "cronjobs":
         spec = manifest.get("spec")
-        if isinstance(spec, MutableMapping):
+        if _is_map(spec):
             schedule = spec.get("schedule")
             if isinstance(schedule, str) and schedule:
                 details.append(f"schedule {schedule}")
     elif resource == "jobs":
         spec = manifest.get("spec")
-        if isinstance(spec, MutableMapping):
+        if _is_map(spec):
             completions = spec.get("completions")
             if isinstance(completions, int):
                 details.append(f"{completions} completion{'s' if completions != 1 else ''}")
@@ -519,58 +746,33 @@ def _format_workload_label(resource: str, manifest: MutableMapping[str, object])
 
 def _services_matching_workloads(
     workloads: Sequence[MutableMapping[str, object]],
-    services: Sequence[MutableMapping[str, object]],
+    services: Iterable[MutableMapping[str, object]],
 ) -> Set[str]:
+    workload_label_sets = [
+        label_set
+        for workload in workloads
+        if (label_set := frozenset(_pod_labels(workload).items()))
+    ]
+    if not workload_label_sets:
+        return set()
+
     matches: Set[str] = set()
     for service in services:
         selector = service.get("spec")
-        if isinstance(selector, MutableMapping):
+        if _is_map(selector):
             selector = selector.get("selector")
-        if not isinstance(selector, MutableMapping) or not selector:
+        if not _is_map(selector) or not selector:
             continue
-        for deployment in workloads:
-            labels = _pod_labels(deployment)
-            if labels and all(labels.get(key) == value for key, value in selector.items()):
-                name = _manifest_name(service)
-                if name:
-                    matches.add(name)
-                break
+        wanted = frozenset(selector.items())
+        if any(wanted <= labels for labels in workload_label_sets):
+            name = _manifest_name(service)
+            if name:
+                matches.add(name)
     return matches
 
 
-def _collect_service_accounts(
-    workloads: Sequence[MutableMapping[str, object]]
-) -> Set[str]:
-    names: Set[str] = set()
-    for manifest in workloads:
-        pod_spec = _pod_spec(manifest)
-        service_account = pod_spec.get("serviceAccountName") or pod_spec.get("serviceAccount")
-        if isinstance(service_account, str) and service_account:
-            names.add(service_account)
-    return names
-
-
-def _collect_persistent_volume_claims(
-    workloads: Sequence[MutableMapping[str, object]]
-) -> Set[str]:
-    names: Set[str] = set()
-    for manifest in workloads:
-        pod_spec = _pod_spec(manifest)
-        volumes = pod_spec.get("volumes")
-        if isinstance(volumes, list):
-            for volume in volumes:
-                if not isinstance(volume, MutableMapping):
-                    continue
-                claim = volume.get("persistentVolumeClaim")
-                if isinstance(claim, MutableMapping):
-                    name = claim.get("claimName") or claim.get("name")
-                    if isinstance(name, str) and name:
-                        names.add(name)
-    return names
-
-
 def _ingresses_for_services(
-    ingresses: Sequence[MutableMapping[str, object]],
+    ingresses: Iterable[MutableMapping[str, object]],
     services: Set[str],
 ) -> Set[str]:
     if not services:
@@ -578,49 +780,50 @@ def _ingresses_for_services(
 
     matches: Set[str] = set()
     for ingress in ingresses:
-        referenced = _services_referenced_by_ingress(ingress)
-        if referenced.intersection(services):
+        if _ingress_references_any(ingress, services):
             name = _manifest_name(ingress)
             if name:
                 matches.add(name)
     return matches
 
 
-def _services_referenced_by_ingress(
-    ingress: MutableMapping[str, object]
-) -> Set[str]:
-    names: Set[str] = set()
+def _ingress_references_any(
+    ingress: MutableMapping[str, object],
+    services: Set[str],
+) -> bool:
+    """Stop walking an ingress spec at the first backend that hits a service."""
     spec = ingress.get("spec")
-    if not isinstance(spec, MutableMapping):
-        return names
+    if not _is_map(spec):
+        return False
 
-    default_backend = spec.get("defaultBackend")
-    names.update(_services_from_backend(default_backend))
+    if _services_from_backend(spec.get("defaultBackend")).intersection(services):
+        return True
 
     rules = spec.get("rules")
     if isinstance(rules, list):
         for rule in rules:
-            if not isinstance(rule, MutableMapping):
+            if not _is_map(rule):
                 continue
             http = rule.get("http")
-            if not isinstance(http, MutableMapping):
+            if not _is_map(http):
                 continue
             paths = http.get("paths")
             if isinstance(paths, list):
                 for path in paths:
-                    if isinstance(path, MutableMapping):
-                        backend = path.get("backend")
-                        names.update(_services_from_backend(backend))
-    return names
+                    if _is_map(path) and _services_from_backend(
+                        path.get("backend")
+                    ).intersection(services):
+                        return True
+    return False
 
 
 def _services_from_backend(backend: object) -> Set[str]:
     names: Set[str] = set()
-    if not isinstance(backend, MutableMapping):
+    if not _is_map(backend):
         return names
 
     service = backend.get("service")
-    if isinstance(service, MutableMapping):
+    if _is_map(service):
         name = service.get("name")
         if isinstance(name, str) and name:
             names.add(name)
@@ -632,25 +835,20 @@ def _services_from_backend(backend: object) -> Set[str]:
     return names
 
 
+def _chain(obj: object, *keys: str) -> object:
+    """Follow a fixed key path through nested mappings, or return None."""
+    for key in keys:
+        if not _is_map(obj):
+            return None
+        obj = obj.get(key)
+    return obj
+
+
 def _pod_spec(manifest: MutableMapping[str, object]) -> MutableMapping[str, object]:
-    spec = manifest.get("spec")
-    if not isinstance(spec, MutableMapping):
-        return {}
-    job_template = spec.get("jobTemplate")
-    if isinstance(job_template, MutableMapping):
-        job_spec = job_template.get("spec")
-        if isinstance(job_spec, MutableMapping):
-            template = job_spec.get("template")
-            if isinstance(template, MutableMapping):
-                template_spec = template.get("spec")
-                if isinstance(template_spec, MutableMapping):
-                    return template_spec
-    template = spec.get("template")
-    if isinstance(template, MutableMapping):
-        template_spec = template.get("spec")
-        if isinstance(template_spec, MutableMapping):
-            return template_spec
-    return {}
+    spec = _chain(manifest, "spec", "jobTemplate", "spec", "template", "spec") or _chain(
+        manifest, "spec", "template", "spec"
+    )
+    return spec if _is_map(spec) else {}
 
 
 def _containers_from_spec(pod_spec: MutableMapping[str, object]) -> Iterator[MutableMapping[str, object]]:
@@ -658,34 +856,21 @@ def _containers_from_spec(pod_spec: MutableMapping[str, object]) -> Iterator[Mut
         containers = pod_spec.get(key)
         if isinstance(containers, list):
             for container in containers:
-                if isinstance(container, MutableMapping):
+                if _is_map(container):
                     yield container
 
 
 def _pod_labels(manifest: MutableMapping[str, object]) -> Dict[str, str]:
-    spec = manifest.get("spec")
-    if not isinstance(spec, MutableMapping):
-        return {}
-    template = spec.get("template")
-    if not isinstance(template, MutableMapping):
-        job_template = spec.get("jobTemplate")
-        if isinstance(job_template, MutableMapping):
-            job_spec = job_template.get("spec")
-            if isinstance(job_spec, MutableMapping):
-                template = job_spec.get("template")
-    if not isinstance(template, MutableMapping):
-        return {}
-    metadata = template.get("metadata")
-    if not isinstance(metadata, MutableMapping):
-        return {}
-    labels = metadata.get("labels")
-    if not isinstance(labels, MutableMapping):
+    labels = _chain(manifest, "spec", "template", "metadata", "labels") or _chain(
+        manifest, "spec", "jobTemplate", "spec", "template", "metadata", "labels"
+    )
+    if not _is_map(labels):
         return {}
-    clean_labels: Dict[str, str] = {}
-    for key, value in labels.items():
-        if isinstance(key, str) and isinstance(value, str):
-            clean_labels[key] = value
-    return clean_labels
+    return {
+        key: value
+        for key, value in labels.items()
+        if isinstance(key, str) and isinstance(value, str)
+    }
 
 
 __all__ = ["SelectionPlan", "build_interactive_plan"]
@@ -1,17 +1,56 @@
 """Robust kubectl interface with retry logic and error handling."""
 from __future__ import annotations
 
+import importlib.util
 import json
 import logging
+import os
+import random
 import shlex
 import subprocess
+import threading
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Optional, Sequence
 
 from .constants import DEFAULT_RETRY_COUNT, DEFAULT_TIMEOUT_SECONDS, DEFAULT_RETRY_BACKOFF_BASE
 from .types import K8sObject, K8sObjectList, KubectlError, ResourceFilter
 
+# Optional fast JSON decoder: kubectl payloads for busy namespaces run to
+# tens of MB, and orjson builds the object tree 2-3x faster than stdlib json.
+if importlib.util.find_spec("orjson") is not None:
+    import orjson
+
+    _json_loads = orjson.loads
+else:  # pragma: no cover - depends on environment
+    _json_loads = json.loads
+
+# Optional pooled API path. When the official kubernetes package is installed,
+# listings reuse a single TLS connection instead of paying process start plus
+# handshake for every kubectl fork; the subprocess path stays as the fallback.
+if importlib.util.find_spec("kubernetes") is not None:
+    import urllib3 as _urllib3
+    from kubernetes import client as _k8s_client
+    from kubernetes import config as _k8s_config
+    from kubernetes.dynamic import DynamicClient as _K8sDynamicClient
+else:  # pragma: no cover - depends on environment
+    _urllib3 = None
+    _k8s_client = None
+    _k8s_config = None
+    _K8sDynamicClient = None
+
+
+def _resource_sort_key(item: K8sObject) -> str:
+    """Name sort key for listings: direct subscripts for the well-typed
+    dicts kubectl emits, with an exception fallback for anything malformed."""
+    try:
+        name = item["metadata"]["name"]
+    except (KeyError, TypeError):
+        return ""
+    return name if type(name) is str else ""
+
 
 class KubectlClient:
     """Robust kubectl client with retry logic and proper error handling."""
@@ -31,7 +70,89 @@ class KubectlClient:
         self.backoff_base = backoff_base
         self.logger = logging.getLogger(__name__)
         self._base_cmd = self._build_base_command()
-    
+        self._dynamic_client = None
+        self._api_client_unavailable = _K8sDynamicClient is None
+        # Per-client RNG so concurrent retries don't serialize on the lock
+        # guarding the module-global random state.
+        self._rng = random.Random()
+        # Short-TTL caches for the repeated probe commands; both are tied to
+        # the kubeconfig/context the base command was built with.
+        self._connection_cache: Optional[tuple] = None
+        self._context_cache: Optional[tuple] = None
+        # Access rarely changes within a run; cache per (type, namespace).
+        self._access_cache: Dict[tuple, bool] = {}
+        # When set (e.g. by a collector shutting down), backoff waits abort
+        # immediately instead of sleeping out their delay.
+        self.cancel_event: Optional[threading.Event] = None
+        self._api_client = None
+
+    def __del__(self):  # pragma: no cover - interpreter shutdown timing
+        api_client = getattr(self, "_api_client", None)
+        if api_client is not None:
+            try:
+                api_client.close()
+            except Exception:
+                pass
+
+    def _get_dynamic_client(self):
+        """Return the shared pooled API client, or None when unavailable."""
+        if self._api_client_unavailable:
+            return None
+        if self._dynamic_client is None:
+            try:
+                configuration = _k8s_client.Configuration()
+                _k8s_config.load_kube_config(
+                    config_file=self.kubeconfig,
+                    context=self.context,
+                    client_configuration=configuration,
+                )
+                # Sized for concurrent listings sharing the one client, with
+                # retries handled inside the pool so every call reuses the
+                # same TCP+TLS connection instead of re-handshaking.
+                configuration.connection_pool_maxsize = 32
+                configuration.retries = _urllib3.util.Retry(
+                    total=self.max_retries, backoff_factor=self.backoff_base
+                )
+                self._api_client = _k8s_client.ApiClient(configuration=configuration)
+                self._dynamic_client = _K8sDynamicClient(self._api_client)
+            except Exception as e:
+                self.logger.debug("Kubernetes API client unavailable, using kubectl: %s", e)
+                self._api_client_unavailable = True
+                return None
+        return self._dynamic_client
+
+    def _list_via_api(
+        self,
+        resource_type: str,
+        namespace: str,
+        selector: Optional[str],
+        field_selector: Optional[str],
+        all_namespaces: bool,
+    ) -> Optional[K8sObjectList]:
+        """List resources through the pooled API client; None means fall back."""
+        dynamic_client = self._get_dynamic_client()
+        if dynamic_client is None:
+            return None
+        try:
+            matches = dynamic_client.resources.search(name=resource_type)
+            if not matches:
+                return None
+            resource = matches[0]
+            kwargs = {}
+            if not all_namespaces and resource.namespaced:
+                kwargs["namespace"] = namespace
+            if selector:
+                kwargs["label_selector"] = selector
+            if field_selector:
+                kwargs["field_selector"] = field_selector
+            response = resource.get(**kwargs)
+            items = [item.to_dict() for item in response.items]
+        except Exception as e:
+            self.logger.debug("API listing of %s failed, using kubectl: %s", resource_type, e)
+            return None
+        items.sort(key=_resource_sort_key)
+        return items
+
     def _build_base_command(self) -> List[str]:
         """Build the base kubectl command with global options."""
         cmd = ["kubectl"]
@@ -51,41 +172,63 @@ class KubectlClient:
         selector: Optional[str] = None,
         field_selector: Optional[str] = None,
         all_namespaces: bool = False,
+        name_only: bool = False,
     ) -> K8sObjectList:
         """
         List resources of a given type.
-        
+
         Args:
             resource_type: Kubernetes resource type (e.g., 'deployments', 'services')
             namespace: Namespace to query (ignored if all_namespaces=True)
             selector: Label selector for filtering
             field_selector: Field selector for filtering
             all_namespaces: Query all namespaces
-            
+            name_only: Fetch only names (-o name); items carry just
+                metadata.name, skipping the full JSON payload and parse
+
         Returns:
             List of Kubernetes resource objects
-            
+
         Raises:
             KubectlError: If kubectl command fails
         """
-        cmd = [*self._base_cmd, "get", resource_type, "-o", "json"]
-        
+        if not name_only:
+            api_items = self._list_via_api(
+                resource_type, namespace, selector, field_selector, all_namespaces
+            )
+            if api_items is not None:
+                return api_items
+
+        output_format = "name" if name_only else "json"
+        cmd = [*self._base_cmd, "get", resource_type, "-o", output_format]
+
         if all_namespaces:
             cmd.append("--all-namespaces")
         else:
             cmd.extend(["-n", namespace])
-        
+
         if selector:
             cmd.extend(["-l", selector])
-        
+
         if field_selector:
             cmd.extend(["--field-selector", field_selector])
-        
+
+        if not name_only:
+            # Have the API server page large listings instead of building one
+            # giant response.
+            cmd.append("--chunk-size=500")
+
         output = self._run_command(cmd)
-        
+
+        if name_only:
+            names = sorted(
+                line.split("/", 1)[1] for line in output.splitlines() if "/" in line
+            )
+            return [{"metadata": {"name": name}} for name in names]
+
         try:
-            data = json.loads(output)
-        except json.JSONDecodeError as e:
+            data = _json_loads(output)
+        except ValueError as e:
             raise KubectlError(f"Failed to parse kubectl output as JSON: {e}", cmd) from e
         
         if not isinstance(data, dict):
@@ -96,10 +239,80 @@ class KubectlClient:
             raise KubectlError(f"Expected 'items' to be a list, got {type(items)}", cmd)
         
         # Sort by name for consistent ordering
-        items.sort(key=lambda item: self._get_resource_name(item))
+        items.sort(key=_resource_sort_key)
         
         return items
     
+    def list_resources_grouped(
+        self,
+        resource_types: Sequence[str],
+        namespace: str = "default",
+        selector: Optional[str] = None,
+    ) -> Dict[str, K8sObjectList]:
+        """
+        List several resource types with a single kubectl call.
+
+        kubectl accepts a comma-separated resource list and returns one mixed
+        item list, so N round-trips collapse into one; items are regrouped by
+        their kind on the client side.
+
+        Args:
+            resource_types: Kubernetes resource types (e.g., ['deployments', 'jobs'])
+            namespace: Namespace to query
+            selector: Label selector for filtering
+
+        Returns:
+            Dictionary mapping each requested resource type to its objects
+
+        Raises:
+            KubectlError: If kubectl command fails
+        """
+        if not resource_types:
+            return {}
+
+        cmd = [*self._base_cmd, "get", ",".join(resource_types), "-o", "json", "-n", namespace]
+        cmd.append("--chunk-size=500")
+
+        if selector:
+            cmd.extend(["-l", selector])
+
+        output = self._run_command(cmd)
+
+        try:
+            data = _json_loads(output)
+        except ValueError as e:
+            raise KubectlError(f"Failed to parse kubectl output as JSON: {e}", cmd) from e
+
+        if not isinstance(data, dict):
+            raise KubectlError(f"Expected JSON object, got {type(data)}", cmd)
+
+        items = data.get("items", [])
+        if not isinstance(items, list):
+            raise KubectlError(f"Expected 'items' to be a list, got {type(items)}", cmd)
+
+        # Map lowercase kinds back to the plural resource names the caller used.
+        requested = {resource_type.lower(): resource_type for resource_type in resource_types}
+        grouped: Dict[str, K8sObjectList] = {resource_type: [] for resource_type in resource_types}
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            kind = item.get("kind")
+            if not isinstance(kind, str):
+                continue
+            kind_lower = kind.lower()
+            resource_type = (
+                requested.get(kind_lower + "s")
+                or requested.get(kind_lower + "es")
+                or requested.get(kind_lower)
+            )
+            if resource_type is not None:
+                grouped[resource_type].append(item)
+
+        for resources in grouped.values():
+            resources.sort(key=_resource_sort_key)
+
+        return grouped
+
     def get_resource(
         self,
         resource_type: str,
@@ -131,8 +344,8 @@ class KubectlClient:
             raise
         
         try:
-            data = json.loads(output)
-        except json.JSONDecodeError as e:
+            data = _json_loads(output)
+        except ValueError as e:
             raise KubectlError(f"Failed to parse kubectl output as JSON: {e}", cmd) from e
         
         if not isinstance(data, dict):
@@ -143,53 +356,75 @@ class KubectlClient:
     def check_connection(self) -> bool:
         """
         Check if kubectl can connect to the cluster.
-        
+
+        The result is cached for 30 seconds, so validation loops and prompt
+        redraws don't fork a kubectl per call.
+
         Returns:
             True if connection is successful, False otherwise
         """
+        if self._connection_cache is not None:
+            checked_at, connected = self._connection_cache
+            if time.monotonic() - checked_at < 30.0:
+                return connected
         try:
             cmd = [*self._base_cmd, "cluster-info"]
-            self._run_command(cmd, retries=1)
-            return True
+            self._run_command_fast(cmd, retries=1)
+            connected = True
         except KubectlError:
-            return False
-    
+            connected = False
+        self._connection_cache = (time.monotonic(), connected)
+        return connected
+
     def get_current_context(self) -> Optional[str]:
         """
         Get the current kubectl context.
-        
+
+        The result is cached for 5 seconds; current-context alone can take
+        hundreds of milliseconds through kubectl.
+
         Returns:
             Current context name or None if unable to determine
         """
+        if self._context_cache is not None:
+            checked_at, context = self._context_cache
+            if time.monotonic() - checked_at < 5.0:
+                return context
         try:
             cmd = [*self._base_cmd, "config", "current-context"]
-            output = self._run_command(cmd, retries=1)
-            return output.strip() or None
+            output = self._run_command_fast(cmd, retries=1)
+            context = output.strip() or None
         except KubectlError:
-            return None
+            context = None
+        self._context_cache = (time.monotonic(), context)
+        return context
     
     def get_namespaces(self) -> List[str]:
         """
         Get list of available namespaces.
-        
+
+        Only names are needed, so this asks for `-o name` output — a few
+        bytes per namespace and no JSON parse — and falls back to the full
+        JSON listing only if the cheap form fails.
+
         Returns:
             List of namespace names
-            
+
         Raises:
             KubectlError: If kubectl command fails
         """
         try:
-            namespaces = self.list_resources("namespaces", all_namespaces=True)
-            return [self._get_resource_name(ns) for ns in namespaces if self._get_resource_name(ns)]
-        except KubectlError:
-            # Fallback - try to get just names
             cmd = [*self._base_cmd, "get", "namespaces", "-o", "name"]
             output = self._run_command(cmd)
-            names = []
-            for line in output.strip().split("\\n"):
-                if "/" in line:
-                    names.append(line.split("/", 1)[1])
-            return names
+        except KubectlError:
+            # Fallback - full objects, reduced to names
+            namespaces = self.list_resources("namespaces", all_namespaces=True)
+            return [name for ns in namespaces if (name := self._get_resource_name(ns))]
+        names = []
+        for line in output.strip().split("\n"):
+            if "/" in line:
+                names.append(line.split("/", 1)[1])
+        return names
     
     def validate_resource_access(self, resource_type: str, namespace: str) -> bool:
         """
@@ -202,13 +437,23 @@ class KubectlClient:
         Returns:
             True if access is available, False otherwise
         """
+        cache_key = (resource_type, namespace)
+        cached = self._access_cache.get(cache_key)
+        if cached is not None:
+            return cached
         try:
             # Try to list resources with a limit of 1 to minimize impact
             cmd = [*self._base_cmd, "get", resource_type, "-n", namespace, "--limit=1", "-o", "name"]
-            self._run_command(cmd, retries=1)
-            return True
+            self._run_command_fast(cmd, retries=1)
+            accessible = True
         except KubectlError:
-            return False
+            accessible = False
+        self._access_cache[cache_key] = accessible
+        return accessible
+
+    def reset_access_cache(self) -> None:
+        """Forget cached access results (for long-running callers whose RBAC may change)."""
+        self._access_cache.clear()
     
     def _run_command(
         self,
@@ -231,7 +476,8 @@ class KubectlClient:
         if retries is None:
             retries = self.max_retries
         
-        self.logger.debug("Running command: %s", shlex.join(cmd))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Running command: %s", shlex.join(cmd))
         
         last_exception = None
         
@@ -271,7 +517,7 @@ class KubectlClient:
             if attempt < retries:
                 delay = self._calculate_backoff_delay(attempt)
                 self.logger.debug("Retrying in %.2f seconds (attempt %d/%d)", delay, attempt + 1, retries)
-                time.sleep(delay)
+                self._wait_before_retry(delay, cmd)
         
         if last_exception:
             self.logger.error("Command failed after %d attempts: %s", retries + 1, last_exception)
@@ -280,13 +526,100 @@ class KubectlClient:
         # This should never be reached, but satisfy type checker
         raise KubectlError("Unknown error occurred", list(cmd))
     
+    def _run_command_fast(
+        self,
+        cmd: Sequence[str],
+        retries: Optional[int] = None,
+    ) -> str:
+        """
+        Run a short kubectl command through a single merged output pipe.
+
+        Folding stderr into stdout leaves one pipe, so communicate() drains it
+        with a plain blocking read instead of the stdlib selector loop that
+        subprocess.run needs for two captured streams. The saving is small per
+        call but adds up across the probe commands that run once per resource
+        type. Retry and backoff behavior mirrors _run_command.
+
+        Args:
+            cmd: Command to execute
+            retries: Number of retries (uses instance default if None)
+
+        Returns:
+            Command output (stdout with stderr merged in)
+
+        Raises:
+            KubectlError: If command fails after all retries
+        """
+        if retries is None:
+            retries = self.max_retries
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Running command: %s", shlex.join(cmd))
+
+        last_exception = None
+
+        for attempt in range(retries + 1):
+            try:
+                proc = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                )
+                try:
+                    output, _ = proc.communicate(timeout=self.timeout)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    proc.communicate()
+                    raise
+
+                if proc.returncode == 0:
+                    if attempt > 0:
+                        self.logger.info("Command succeeded after %d retries", attempt)
+                    return output
+
+                error_msg = (output or "").strip() or f"exit code {proc.returncode}"
+                last_exception = KubectlError(f"kubectl failed: {error_msg}", list(cmd))
+
+                # Don't retry certain types of errors
+                if self._is_non_retryable_error(error_msg):
+                    break
+
+            except subprocess.TimeoutExpired:
+                last_exception = KubectlError(
+                    f"Command timed out after {self.timeout} seconds",
+                    list(cmd)
+                )
+
+            except Exception as e:
+                last_exception = KubectlError(f"Unexpected error: {e}", list(cmd))
+
+            # Wait before retrying (except on last attempt)
+            if attempt < retries:
+                delay = self._calculate_backoff_delay(attempt)
+                self.logger.debug("Retrying in %.2f seconds (attempt %d/%d)", delay, attempt + 1, retries)
+                self._wait_before_retry(delay, cmd)
+
+        if last_exception:
+            self.logger.error("Command failed after %d attempts: %s", retries + 1, last_exception)
+            raise last_exception
+
+        # This should never be reached, but satisfy type checker
+        raise KubectlError("Unknown error occurred", list(cmd))
+
+    def _wait_before_retry(self, delay: float, cmd: Sequence[str]) -> None:
+        """Sleep out a backoff delay, aborting at once if cancellation is signalled."""
+        cancel_event = self.cancel_event
+        if cancel_event is None:
+            time.sleep(delay)
+        elif cancel_event.wait(delay):
+            raise KubectlError("Cancelled while waiting to retry", list(cmd))
+
     def _calculate_backoff_delay(self, attempt: int) -> float:
         """Calculate exponential backoff delay with jitter."""
-        import random
-        
         base_delay = self.backoff_base ** attempt
         # Add some jitter to avoid thundering herd
-        jitter = random.uniform(0.8, 1.2)
+        jitter = self._rng.uniform(0.8, 1.2)
         return min(base_delay * jitter, 60.0)  # Cap at 60 seconds
     
     def _is_non_retryable_error(self, error_msg: str) -> bool:
@@ -322,7 +655,25 @@ class KubectlResourceCollector:
     def __init__(self, kubectl_client: KubectlClient):
         self.kubectl = kubectl_client
         self.logger = logging.getLogger(__name__)
-    
+        # Each kubectl call is independent I/O, so collection and access
+        # checks fan out through one shared pool instead of running serially.
+        self._executor = ThreadPoolExecutor(
+            max_workers=min(32, (os.cpu_count() or 4) * 4)
+        )
+        # Shared with the client so pooled calls stuck in retry backoff wake
+        # up immediately when the collector is cancelled.
+        self._cancel_event = threading.Event()
+        if kubectl_client.cancel_event is None:
+            kubectl_client.cancel_event = self._cancel_event
+        # Cluster-wide listings bucketed by namespace, keyed by
+        # (resource_type, selector) so repeat namespace sweeps are lookups.
+        self._all_namespaces_cache: Dict[tuple, Dict[str, K8sObjectList]] = {}
+
+    def cancel(self) -> None:
+        """Abort pending work: pooled calls waiting in retry backoff fail fast."""
+        self._cancel_event.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
     def collect_resources(
         self,
         resource_types: Sequence[str],
@@ -330,42 +681,108 @@ class KubectlResourceCollector:
     ) -> Dict[str, K8sObjectList]:
         """
         Collect multiple resource types with filtering.
-        
+
         Args:
             resource_types: List of resource types to collect
             filters: Filters to apply
-            
+
         Returns:
             Dictionary mapping resource types to their objects
         """
         results: Dict[str, K8sObjectList] = {}
-        
-        for resource_type in resource_types:
+
+        namespace = filters.get("namespace", "default")
+        selector = filters.get("selector")
+        futures = {
+            resource_type: self._executor.submit(
+                self.kubectl.list_resources,
+                resource_type=resource_type,
+                namespace=namespace,
+                selector=selector,
+            )
+            for resource_type in resource_types
+        }
+
+        # Gather in submission order so results iterates in resource_types
+        # order regardless of which kubectl call finishes first.
+        for resource_type, future in futures.items():
             try:
-                self.logger.debug("Collecting %s resources", resource_type)
-                
-                resources = self.kubectl.list_resources(
-                    resource_type=resource_type,
-                    namespace=filters.get("namespace", "default"),
-                    selector=filters.get("selector"),
-                )
-                
+                resources = future.result()
+
                 # Apply additional filtering
                 filtered_resources = self._apply_filters(resources, filters)
-                
+
                 if filtered_resources:
                     results[resource_type] = filtered_resources
                     self.logger.info("Collected %d %s resources", len(filtered_resources), resource_type)
                 else:
                     self.logger.debug("No %s resources found matching filters", resource_type)
-                    
+
             except KubectlError as e:
                 self.logger.warning("Failed to collect %s: %s", resource_type, e)
                 # Continue with other resource types
                 continue
-        
+
         return results
     
+    def collect_resources_all_namespaces(
+        self,
+        resource_types: Sequence[str],
+        filters: ResourceFilter,
+    ) -> Dict[str, Dict[str, K8sObjectList]]:
+        """
+        Collect resource types across every namespace with one call per type.
+
+        One --all-namespaces query replaces a query per (type, namespace)
+        pair; items are bucketed by namespace client-side and the buckets are
+        cached, so sweeping K namespaces costs N kubectl calls instead of K*N.
+
+        Args:
+            resource_types: List of resource types to collect
+            filters: Filters to apply (namespace is ignored; selector is used)
+
+        Returns:
+            Dictionary mapping resource types to per-namespace object lists
+        """
+        selector = filters.get("selector")
+        futures = {}
+        for resource_type in resource_types:
+            if (resource_type, selector) not in self._all_namespaces_cache:
+                futures[self._executor.submit(
+                    self.kubectl.list_resources,
+                    resource_type=resource_type,
+                    selector=selector,
+                    all_namespaces=True,
+                )] = resource_type
+
+        for future in as_completed(futures):
+            resource_type = futures[future]
+            try:
+                resources = future.result()
+            except KubectlError as e:
+                self.logger.warning("Failed to collect %s: %s", resource_type, e)
+                continue
+            buckets: Dict[str, K8sObjectList] = defaultdict(list)
+            for item in resources:
+                metadata = item.get("metadata", {})
+                namespace = metadata.get("namespace") if isinstance(metadata, dict) else None
+                buckets[namespace or ""].append(item)
+            self._all_namespaces_cache[(resource_type, selector)] = dict(buckets)
+
+        results: Dict[str, Dict[str, K8sObjectList]] = {}
+        for resource_type in resource_types:
+            buckets = self._all_namespaces_cache.get((resource_type, selector))
+            if buckets is None:
+                continue
+            filtered_buckets = {
+                namespace: filtered
+                for namespace, bucket in buckets.items()
+                if (filtered := self._apply_filters(bucket, filters))
+            }
+            if filtered_buckets:
+                results[resource_type] = filtered_buckets
+        return results
+
     def _apply_filters(
         self,
         resources: K8sObjectList,
@@ -378,9 +795,10 @@ class KubectlResourceCollector:
         names = filters.get("names")
         if names:
             name_set = set(names)
+            get_name = self.kubectl._get_resource_name
             filtered = [
                 resource for resource in filtered
-                if self.kubectl._get_resource_name(resource) in name_set
+                if get_name(resource) in name_set
             ]
         
         return filtered
@@ -396,9 +814,10 @@ class KubectlResourceCollector:
         Returns:
             Dictionary mapping resource types to access status
         """
-        results = {}
-        
-        for resource_type in resource_types:
-            results[resource_type] = self.kubectl.validate_resource_access(resource_type, namespace)
-        
-        return results
\ No newline at end of file
+        futures = {
+            resource_type: self._executor.submit(
+                self.kubectl.validate_resource_access, resource_type, namespace
+            )
+            for resource_type in resource_types
+        }
+        return {resource_type: future.result() for resource_type, future in futures.items()}
\ No newline at end of file
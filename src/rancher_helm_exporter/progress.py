@@ -1,100 +1,261 @@
 """Progress tracking utilities for export operations."""
 from __future__ import annotations
 
+import atexit
+import importlib.util
+import io
 import logging
+import queue
 import sys
+import threading
 import time
-from typing import Optional, Protocol
+from array import array
+from typing import Optional
 
 from .types import ProgressCallback
 
+# One logger for the module; per-instance getLogger calls pay a manager
+# dict lookup plus lock acquisition for the same object every time.
+_LOG = logging.getLogger(__name__)
+
+# Probe for rich once at import time; RichProgressTracker and the factory
+# below consult the cached classes instead of re-resolving the import (and
+# its ImportError fallback) on every tracker construction.
+if importlib.util.find_spec("rich") is not None:
+    from rich.progress import BarColumn, Progress, TextColumn, TimeRemainingColumn
+
+    _RICH_AVAILABLE = True
+else:  # pragma: no cover - depends on environment
+    _RICH_AVAILABLE = False
+
+
+class _EncodingWriter:
+    """Binary-writer adapter over a text stream, for the no-fd fallback."""
+
+    __slots__ = ("_stream",)
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, data: bytes) -> None:
+        self._stream.write(data.decode("utf-8", "replace"))
+
+    def flush(self) -> None:
+        self._stream.flush()
+
+
+def _open_progress_stream():
+    """Build a buffered binary stream over stderr for progress output.
+
+    Throttled progress still issues one write() syscall per rendered tick
+    when going through print(..., flush=True). Buffering intermediate
+    carriage-return updates and flushing only on the final line collapses
+    those into a handful of syscalls, and writing pre-encoded bytes skips
+    the text layer's encoder per write. The fd is wrapped with
+    closefd=False so closing this stream can never close stderr itself;
+    streams without a real fd (e.g. captured stderr in tests) go through
+    an encoding adapter over the plain sys.stderr object.
+    """
+    try:
+        raw = io.FileIO(sys.stderr.fileno(), "w", closefd=False)
+    except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+        return _EncodingWriter(sys.stderr)
+    stream = io.BufferedWriter(raw, buffer_size=8192)
+    # Guarantee buffered progress is drained even on abnormal exit.
+    atexit.register(stream.flush)
+    return stream
+
+
+_PROGRESS_STREAM = _open_progress_stream()
+
 
 class ProgressTracker(ProgressCallback):
     """Simple progress tracker with console output."""
+    __slots__ = (
+        "enabled",
+        "show_percentage",
+        "_last_update_ns",
+        "_update_interval_ns",
+        "_born_ns",
+        "_reveal_after_ns",
+        "_out",
+    )
+
     
     def __init__(self, enabled: bool = True, show_percentage: bool = True):
         self.enabled = enabled
         self.show_percentage = show_percentage
-        self.logger = logging.getLogger(__name__)
-        self._last_update = 0.0
-        self._update_interval = 0.1  # Update at most every 100ms
+        self._last_update_ns = 0
+        self._update_interval_ns = 100_000_000  # Update at most every 100ms
+        # Stay silent for the first 500 ms: short exports finish before a
+        # human would read the bar, and skipping the reveal keeps trivial
+        # runs free of terminal writes entirely.
+        self._born_ns = time.monotonic_ns()
+        self._reveal_after_ns = 500_000_000
+        self._out = _PROGRESS_STREAM
     
     def update(self, current: int, total: int, message: str = "") -> None:
         """Update progress display."""
         if not self.enabled:
             return
         
-        # Throttle updates
-        now = time.time()
-        if now - self._last_update < self._update_interval and current < total:
+        # Throttle updates. monotonic_ns keeps the gate an integer compare
+        # (no float conversion) and is immune to wall-clock jumps. The
+        # gate is a lock-free monotonic ratchet: one read of the last
+        # timestamp into a local, one unconditional store on emission.
+        # Concurrent callers racing past it can at worst draw one extra
+        # frame -- the GIL guarantees the int store itself is atomic -- so
+        # no lock is worth its cost here. Multi-producer fan-out is
+        # already serialized by RichProgressTracker's update queue.
+        now_ns = time.monotonic_ns()
+        last_ns = self._last_update_ns
+        if current < total and (
+            now_ns - self._born_ns < self._reveal_after_ns
+            or now_ns - last_ns < self._update_interval_ns
+        ):
             return
         
-        self._last_update = now
+        self._last_update_ns = now_ns
         
+        # Build the line as bytes joined once: the counters format through
+        # bytes %-interpolation and only a caller-supplied message pays an
+        # encode, so the write lands on the binary stream ready to go.
         if total > 0:
+            parts = [b"\rProgress: %d/%d" % (current, total)]
             if self.show_percentage:
-                percentage = (current / total) * 100
-                progress_msg = f"Progress: {current}/{total} ({percentage:.1f}%)"
-            else:
-                progress_msg = f"Progress: {current}/{total}"
+                parts.append(b" (%.1f%%)" % (current * 100 / total))
         else:
-            progress_msg = f"Processed: {current}"
+            parts = [b"\rProcessed: %d" % current]
         
         if message:
-            progress_msg += f" - {message}"
+            parts.append(b" - ")
+            parts.append(message.encode("utf-8", "replace"))
         
-        # Use carriage return to overwrite the line
+        # Use carriage return to overwrite the line; intermediate updates
+        # stay in the stream buffer and only the final one forces a flush.
         if current < total:
-            print(f"\\r{progress_msg}", end="", flush=True)
+            self._out.write(b"".join(parts))
         else:
-            print(f"\\r{progress_msg}")  # Final update with newline
+            parts.append(b"\n")  # Final update with newline
+            self._out.write(b"".join(parts))
+            self._out.flush()
     
     def finish(self, message: str = "Complete") -> None:
         """Mark progress as finished."""
         if self.enabled:
-            print(f"\\r{message}")
+            self._out.write(b"\r" + message.encode("utf-8", "replace") + b"\n")
+            self._out.flush()
 
 
 class SilentProgressTracker(ProgressCallback):
     """Progress tracker that only logs to the logger."""
+    __slots__ = ("log_interval", "_mask", "_next_log_at", "_info_enabled", "_info_checked_ns")
+
     
     def __init__(self, log_interval: int = 10):
         self.log_interval = log_interval
-        self.logger = logging.getLogger(__name__)
-        self._last_logged = 0
+        # Power-of-two intervals reduce the per-item gate to a mask test;
+        # anything else compares against a running next-log threshold. Both
+        # avoid the modulo division the old gate paid on every update.
+        if log_interval > 0 and log_interval & (log_interval - 1) == 0:
+            self._mask: Optional[int] = log_interval - 1
+        else:
+            self._mask = None
+            self._next_log_at = 0
+        # Cache the effective-level check; isEnabledFor walks the logger
+        # hierarchy under the manager lock, so re-probe at most once a
+        # second to still honor runtime level changes.
+        self._info_enabled = _LOG.isEnabledFor(logging.INFO)
+        self._info_checked_ns = time.monotonic_ns()
     
     def update(self, current: int, total: int, message: str = "") -> None:
         """Log progress updates at intervals."""
-        if current == 0 or current % self.log_interval == 0 or current == total:
-            if total > 0:
-                percentage = (current / total) * 100
-                self.logger.info("Progress: %d/%d (%.1f%%) %s", current, total, percentage, message)
-            else:
-                self.logger.info("Processed: %d %s", current, message)
+        if self._mask is not None:
+            if current and current & self._mask and current != total:
+                return
+        else:
+            if current < self._next_log_at and current != total:
+                return
+            self._next_log_at = current + self.log_interval
+        now_ns = time.monotonic_ns()
+        if now_ns - self._info_checked_ns >= 1_000_000_000:
+            self._info_enabled = _LOG.isEnabledFor(logging.INFO)
+            self._info_checked_ns = now_ns
+        if not self._info_enabled:
+            return
+        if total > 0:
+            percentage = (current / total) * 100
+            _LOG.info("Progress: %d/%d (%.1f%%) %s", current, total, percentage, message)
+        else:
+            _LOG.info("Processed: %d %s", current, message)
+
+
+class NullProgressTracker(ProgressCallback):
+    """No-op tracker for fully disabled progress.
+
+    When progress is off, callers still invoke update() once per exported
+    object; this keeps that call to a bare method returning None, with no
+    enabled flag, throttle arithmetic, or logger check in the body.
+    """
+
+    __slots__ = ()
+
+    def update(self, current: int, total: int, message: str = "") -> None:
+        return None
+
+    def finish(self, message: str = "Complete") -> None:
+        return None
+
+
+# Stateless, so one shared instance serves every disabled caller.
+_NULL_TRACKER = NullProgressTracker()
 
 
 class RichProgressTracker(ProgressCallback):
     """Progress tracker using rich library for enhanced display."""
+    __slots__ = (
+        "enabled",
+        "progress",
+        "task_id",
+        "fallback",
+        "_queue",
+        "_worker",
+        "_born_ns",
+        "_started",
+        "_last_desc",
+    )
+
     
     def __init__(self):
         self.enabled = True
         self.progress = None
         self.task_id = None
         
-        try:
-            from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn
-            self.progress = Progress(
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                TextColumn("({task.completed}/{task.total})"),
-                TimeRemainingColumn(),
-            )
-            self.progress.start()
-        except ImportError:
+        if not _RICH_AVAILABLE:
             # Fallback to simple tracker if rich is not available
             self.enabled = False
             self.fallback = ProgressTracker()
+            return
+        self.progress = Progress(
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+            TextColumn("({task.completed}/{task.total})"),
+            TimeRemainingColumn(),
+        )
+        # The live display starts lazily on the first rendered update past
+        # the reveal window, so trivially short exports never draw a bar.
+        self._born_ns = time.monotonic_ns()
+        self._started = False
+        self._last_desc: Optional[str] = None
+        # Terminal rendering happens on a daemon thread fed through a
+        # bounded queue, keeping slow TTY writes off the export hot path;
+        # update() only pays for an enqueue.
+        self._queue: queue.Queue = queue.Queue(maxsize=2048)
+        self._worker = threading.Thread(
+            target=self._drain, name="rich-progress", daemon=True
+        )
+        self._worker.start()
     
     def update(self, current: int, total: int, message: str = "") -> None:
         """Update progress using rich progress bar."""
@@ -102,18 +263,65 @@ class RichProgressTracker(ProgressCallback):
             self.fallback.update(current, total, message)
             return
         
+        try:
+            self._queue.put_nowait((current, total, message))
+        except queue.Full:
+            # Drop rather than block the caller; a newer update follows.
+            pass
+    
+    def _drain(self) -> None:
+        """Render queued updates, coalescing backlog to the newest state."""
+        while True:
+            item = self._queue.get()
+            # Collapse whatever queued up behind this item: only the most
+            # recent state is worth drawing, so one wakeup renders once no
+            # matter how many updates arrived since the last frame.
+            while item is not None:
+                try:
+                    newer = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if newer is None:
+                    self._render(item)
+                    return
+                item = newer
+            if item is None:
+                return
+            self._render(item)
+    
+    def _render(self, item: tuple) -> None:
+        """Apply one (current, total, message) update to the rich bar."""
+        current, total, message = item
+        if not self._started:
+            if current < total and time.monotonic_ns() - self._born_ns < 500_000_000:
+                return
+            self.progress.start()
+            self._started = True
+        description = message or "Processing..."
         if self.task_id is None and self.progress:
-            self.task_id = self.progress.add_task(message or "Processing...", total=total)
+            self.task_id = self.progress.add_task(description, total=total)
+            self._last_desc = description
         
         if self.progress and self.task_id is not None:
-            self.progress.update(self.task_id, completed=current, description=message or "Processing...")
+            # Only resend the description when it changed; rich diffs the
+            # renderable, but skipping the kwarg avoids re-stamping the
+            # task (and the redraw it triggers) for every tick that only
+            # advances the counter.
+            if description != self._last_desc:
+                self.progress.update(self.task_id, completed=current, description=description)
+                self._last_desc = description
+            else:
+                self.progress.update(self.task_id, completed=current)
     
     def finish(self, message: str = "Complete") -> None:
         """Finish the progress tracking."""
         if self.enabled and self.progress:
-            if self.task_id is not None:
-                self.progress.update(self.task_id, description=message)
-            self.progress.stop()
+            self._queue.put(None)
+            self._worker.join(timeout=1.0)
+            if self._started:
+                if self.task_id is not None:
+                    self.progress.update(self.task_id, description=message)
+                self.progress.stop()
         elif hasattr(self, 'fallback'):
             self.fallback.finish(message)
 
@@ -135,80 +343,111 @@ def create_progress_tracker(
         Appropriate progress tracker instance
     """
     if not enabled:
-        return SilentProgressTracker()
+        return _NULL_TRACKER
     
     if silent:
         return SilentProgressTracker()
     
-    if use_rich:
-        try:
-            return RichProgressTracker()
-        except ImportError:
-            pass
+    if use_rich and _RICH_AVAILABLE:
+        return RichProgressTracker()
     
     return ProgressTracker(enabled=enabled)
 
 
 class BatchProgressTracker:
     """Tracks progress across multiple batches or phases."""
+    __slots__ = (
+        "tracker",
+        "_phase_names",
+        "_phase_totals",
+        "_phase_offsets",
+        "current_phase",
+        "completed_items",
+    )
+
     
     def __init__(self, progress_tracker: ProgressCallback):
         self.tracker = progress_tracker
-        self.phases: list[tuple[str, int]] = []
+        # Phases live in parallel arrays rather than a list of tuples:
+        # names in a list, sizes and their prefix sums as C-backed int64
+        # arrays. Per-item updates index straight into each array with no
+        # tuple object to unpack, and _phase_offsets[-1] doubles as the
+        # overall item total. A zero-sized sentinel phase sits past the
+        # last real one, so completing or updating after the final phase
+        # indexes the sentinel instead of needing a bounds check.
+        self._phase_names: list[str] = ["Complete"]
+        self._phase_totals = array("q", [0])
+        self._phase_offsets = array("q", [0])
         self.current_phase = 0
-        self.total_items = 0
         self.completed_items = 0
     
     def add_phase(self, name: str, item_count: int) -> None:
         """Add a phase to track."""
-        self.phases.append((name, item_count))
-        self.total_items += item_count
+        # Insert before the trailing sentinel.
+        self._phase_names[-1] = name
+        self._phase_names.append("Complete")
+        self._phase_totals[-1] = item_count
+        self._phase_totals.append(0)
+        self._phase_offsets.append(self._phase_offsets[-1] + item_count)
     
     def start_phase(self, phase_index: int) -> None:
         """Start tracking a specific phase."""
-        if 0 <= phase_index < len(self.phases):
+        if 0 <= phase_index < len(self._phase_names) - 1:
             self.current_phase = phase_index
     
     def update_phase_progress(self, current: int) -> None:
         """Update progress within the current phase."""
-        if self.current_phase < len(self.phases):
-            phase_name, phase_total = self.phases[self.current_phase]
-            
-            # Calculate total progress
-            items_before_current_phase = sum(
-                count for _, count in self.phases[:self.current_phase]
-            )
-            total_completed = items_before_current_phase + current
-            
-            message = f"{phase_name} ({current}/{phase_total})"
-            self.tracker.update(total_completed, self.total_items, message)
+        phase = self.current_phase
+        total_completed = self._phase_offsets[phase] + current
+        
+        message = f"{self._phase_names[phase]} ({current}/{self._phase_totals[phase]})"
+        self.tracker.update(total_completed, self._phase_offsets[-1], message)
     
     def complete_phase(self) -> None:
         """Mark the current phase as complete and move to the next."""
-        if self.current_phase < len(self.phases):
-            _, phase_count = self.phases[self.current_phase]
-            self.completed_items += phase_count
-            self.current_phase += 1
+        phase = self.current_phase
+        self.completed_items += self._phase_totals[phase]
+        # Advance, but never step past the sentinel; the bool add keeps
+        # this branchless.
+        self.current_phase = phase + (phase < len(self._phase_totals) - 1)
     
     def finish(self) -> None:
         """Mark all phases as complete."""
-        self.tracker.update(self.total_items, self.total_items, "Complete")
+        total_items = self._phase_offsets[-1]
+        self.tracker.update(total_items, total_items, "Complete")
 
 
 class TimedProgressTracker:
     """Progress tracker that also measures and reports timing."""
+    __slots__ = (
+        "tracker",
+        "start_time_ns",
+        "phase_start_time_ns",
+        "_last_timing_ns",
+        "_cached_timing_msg",
+    )
+
     
     def __init__(self, progress_tracker: ProgressCallback):
         self.tracker = progress_tracker
-        self.start_time = time.time()
-        self.phase_start_time = time.time()
-        self.logger = logging.getLogger(__name__)
+        self.start_time_ns = time.monotonic_ns()
+        self.phase_start_time_ns = self.start_time_ns
+        self._last_timing_ns = 0
+        self._cached_timing_msg = ""
     
     def update(self, current: int, total: int, message: str = "") -> None:
         """Update progress with timing information."""
-        elapsed = time.time() - self.start_time
+        # Integer nanosecond arithmetic throughout; divide into seconds
+        # only when formatting. The downstream tracker throttles redraws
+        # to 100 ms anyway, so rate/ETA are refreshed on the same cadence
+        # and suppressed ticks reuse the cached suffix instead of paying
+        # the divisions and formatting again.
+        now_ns = time.monotonic_ns()
         
-        if current > 0:
+        if current < total and now_ns - self._last_timing_ns < 100_000_000:
+            timing_msg = self._cached_timing_msg
+        elif current > 0 and now_ns > self.start_time_ns:
+            elapsed = (now_ns - self.start_time_ns) / 1e9
             rate = current / elapsed
             if total > current:
                 eta = (total - current) / rate
@@ -216,25 +455,30 @@ class TimedProgressTracker:
             else:
                 timing_msg = f"Rate: {rate:.1f}/s, Total time: {elapsed:.1f}s"
             
-            if message:
-                message = f"{message} | {timing_msg}"
-            else:
-                message = timing_msg
+            self._cached_timing_msg = timing_msg
+            self._last_timing_ns = now_ns
+        else:
+            timing_msg = ""
+        
+        if timing_msg:
+            message = f"{message} | {timing_msg}" if message else timing_msg
         
         self.tracker.update(current, total, message)
     
     def start_phase(self, phase_name: str) -> None:
         """Start timing a new phase."""
-        self.phase_start_time = time.time()
-        self.logger.info("Starting phase: %s", phase_name)
+        self.phase_start_time_ns = time.monotonic_ns()
+        _LOG.info("Starting phase: %s", phase_name)
     
     def end_phase(self, phase_name: str) -> None:
         """End timing the current phase."""
-        phase_duration = time.time() - self.phase_start_time
-        self.logger.info("Completed phase '%s' in %.2fs", phase_name, phase_duration)
+        if _LOG.isEnabledFor(logging.INFO):
+            phase_duration = (time.monotonic_ns() - self.phase_start_time_ns) / 1e9
+            _LOG.info("Completed phase '%s' in %.2fs", phase_name, phase_duration)
     
     def finish(self) -> None:
         """Finish tracking with total time."""
-        total_time = time.time() - self.start_time
-        self.logger.info("Export completed in %.2fs", total_time)
+        total_time = (time.monotonic_ns() - self.start_time_ns) / 1e9
+        if _LOG.isEnabledFor(logging.INFO):
+            _LOG.info("Export completed in %.2fs", total_time)
         self.tracker.finish(f"Complete (took {total_time:.1f}s)")
\ No newline at end of file
@@ -1,6 +1,7 @@
 """Type definitions for Kubernetes resources and internal data structures."""
 from __future__ import annotations
 
+import sys
 from typing import Any, Dict, List, Mapping, Optional, Protocol, Sequence, TypedDict, Union
 
 # Basic Kubernetes types
@@ -81,6 +82,66 @@ class SecretData(TypedDict, total=False):
     type: Optional[str]
 
 
+class K8sManifest:
+    """Flat record view of a manifest for hot read paths.
+
+    The TypedDict shapes above describe raw kubectl output, where reading
+    kind or name costs chained dict lookups on every access. This record
+    hoists the well-known fields into slot attributes once at
+    construction; nested payloads such as spec keep their dict form.
+    __slots__ is declared by hand rather than via dataclass(slots=True),
+    which needs Python 3.10 while the package supports 3.9.
+    """
+
+    __slots__ = (
+        "api_version",
+        "kind",
+        "name",
+        "namespace",
+        "labels",
+        "annotations",
+        "spec",
+        "status",
+    )
+
+    def __init__(
+        self,
+        api_version: str = "",
+        kind: str = "",
+        name: str = "",
+        namespace: Optional[str] = None,
+        labels: Optional[Dict[str, str]] = None,
+        annotations: Optional[Dict[str, str]] = None,
+        spec: Optional[Dict[str, Any]] = None,
+        status: Optional[Dict[str, Any]] = None,
+    ):
+        self.api_version = api_version
+        self.kind = kind
+        self.name = name
+        self.namespace = namespace
+        self.labels = {} if labels is None else labels
+        self.annotations = {} if annotations is None else annotations
+        self.spec = {} if spec is None else spec
+        self.status = status
+
+    @classmethod
+    def from_dict(cls, manifest: K8sObject) -> "K8sManifest":
+        """Extract the well-known fields from a raw manifest once."""
+        metadata = manifest.get("metadata")
+        if not isinstance(metadata, dict):
+            metadata = {}
+        return cls(
+            api_version=manifest.get("apiVersion", ""),
+            kind=manifest.get("kind", ""),
+            name=metadata.get("name", ""),
+            namespace=metadata.get("namespace"),
+            labels=metadata.get("labels") or {},
+            annotations=metadata.get("annotations") or {},
+            spec=manifest.get("spec") or {},
+            status=manifest.get("status"),
+        )
+
+
 class ResourceReference(TypedDict, total=False):
     """Reference to another Kubernetes resource."""
     name: str
@@ -171,6 +232,8 @@ class ChartGeneratorProtocol(Protocol):
 class ProgressCallback(Protocol):
     """Callback for progress updates."""
     
+    __slots__ = ()
+    
     def update(self, current: int, total: int, message: str = "") -> None:
         """Update progress."""
         ...
@@ -244,18 +307,25 @@ class SelectionResult(TypedDict):
     metadata: Optional[Dict[str, Any]]
 
 
-# Error types
+# Error types. The extra payload attributes are slotted so error-heavy
+# runs (partial failures across thousands of resources) never allocate
+# the lazy per-instance dict, and resource_type is interned: the handful
+# of distinct kinds share one string object, comparable by identity.
 class ExportError(Exception):
     """Base exception for export operations."""
     
+    __slots__ = ("resource_type",)
+    
     def __init__(self, message: str, resource_type: Optional[str] = None):
         super().__init__(message)
-        self.resource_type = resource_type
+        self.resource_type = sys.intern(resource_type) if resource_type else None
 
 
 class KubectlError(ExportError):
     """Error from kubectl operations."""
     
+    __slots__ = ("command",)
+    
     def __init__(self, message: str, command: Optional[List[str]] = None):
         super().__init__(message)
         self.command = command
@@ -264,6 +334,8 @@ class KubectlError(ExportError):
 class ManifestValidationError(ExportError):
     """Error validating manifest structure."""
     
+    __slots__ = ("manifest",)
+    
     def __init__(self, message: str, manifest: Optional[K8sObject] = None):
         super().__init__(message)
         self.manifest = manifest
@@ -271,7 +343,8 @@ class ManifestValidationError(ExportError):
 
 class ChartGenerationError(ExportError):
     """Error generating Helm chart."""
-    pass
+    
+    __slots__ = ()
 
 
 # Type aliases for common patterns
@@ -2,453 +2,766 @@
 from __future__ import annotations
 
 import time
-from typing import Any, Dict, Iterator, List, Optional, Set, Union
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple, Union
 
-from .constants import K8sFields
+from .constants import K8sFields, ResourceTypes
 from .types import K8sObject, ManifestDict
 
+# kubectl emits plain dict/list/str trees -- YAML/JSON loading never
+# produces subclasses for these fields -- so exact type tests suffice
+# here and skip isinstance's MRO walk and __instancecheck__ hook on every
+# field access in the traversal hot paths.
+_D = dict
+_L = list
+_S = str
 
-class ManifestTraverser:
-    """Utility for traversing Kubernetes manifest structures."""
+# Field-name constants hoisted to module level once: every traversal call
+# otherwise repeats a LOAD_ATTR on K8sFields per dict hop.
+_F_METADATA = K8sFields.METADATA
+_F_NAME = K8sFields.NAME
+_F_NAMESPACE = K8sFields.NAMESPACE
+_F_SPEC = K8sFields.SPEC
+_F_JOB_TEMPLATE = K8sFields.JOB_TEMPLATE
+_F_TEMPLATE = K8sFields.TEMPLATE
+_F_LABELS = K8sFields.LABELS
+_F_CONTAINERS = K8sFields.CONTAINERS
+_F_INIT_CONTAINERS = K8sFields.INIT_CONTAINERS
+_F_EPHEMERAL_CONTAINERS = K8sFields.EPHEMERAL_CONTAINERS
+_F_REPLICAS = K8sFields.REPLICAS
+_F_SCHEDULE = K8sFields.SCHEDULE
+_F_COMPLETIONS = K8sFields.COMPLETIONS
+_F_VOLUMES = K8sFields.VOLUMES
+_F_CONFIG_MAP = K8sFields.CONFIG_MAP
+_F_PROJECTED = K8sFields.PROJECTED
+_F_SOURCES = K8sFields.SOURCES
+_F_ENV_FROM = K8sFields.ENV_FROM
+_F_CONFIG_MAP_REF = K8sFields.CONFIG_MAP_REF
+_F_ENV = K8sFields.ENV
+_F_VALUE_FROM = K8sFields.VALUE_FROM
+_F_CONFIG_MAP_KEY_REF = K8sFields.CONFIG_MAP_KEY_REF
+_F_IMAGE_PULL_SECRETS = K8sFields.IMAGE_PULL_SECRETS
+_F_SECRET = K8sFields.SECRET
+_F_SECRET_NAME = K8sFields.SECRET_NAME
+_F_SECRET_REF = K8sFields.SECRET_REF
+_F_SECRET_KEY_REF = K8sFields.SECRET_KEY_REF
+_F_SERVICE_ACCOUNT_NAME = K8sFields.SERVICE_ACCOUNT_NAME
+_F_SERVICE_ACCOUNT = K8sFields.SERVICE_ACCOUNT
+_F_PERSISTENT_VOLUME_CLAIM = K8sFields.PERSISTENT_VOLUME_CLAIM
+_F_CLAIM_NAME = K8sFields.CLAIM_NAME
+_F_SELECTOR = K8sFields.SELECTOR
+_F_DEFAULT_BACKEND = K8sFields.DEFAULT_BACKEND
+_F_RULES = K8sFields.RULES
+_F_HTTP = K8sFields.HTTP
+_F_PATHS = K8sFields.PATHS
+_F_BACKEND = K8sFields.BACKEND
+_F_SERVICE = K8sFields.SERVICE
+_F_SERVICE_NAME = K8sFields.SERVICE_NAME
+
+
+class WorkloadSummary(NamedTuple):
+    """Commonly read workload fields, extracted in a single walk."""
+
+    name: str
+    namespace: Optional[str]
+    replicas: int
+    schedule: Optional[str]
+    completions: Optional[int]
+
+
+def get_metadata(manifest: K8sObject) -> Dict[str, Any]:
+    """Extract metadata from a manifest."""
+    metadata = manifest.get(_F_METADATA)
+    return metadata if type(metadata) is _D else {}
+
+
+def get_manifest_name(manifest: K8sObject) -> str:
+    """Extract name from manifest metadata."""
+    metadata = get_metadata(manifest)
+    name = metadata.get(_F_NAME)
+    return str(name) if type(name) is _S else ""
+
+
+def get_manifest_namespace(manifest: K8sObject) -> Optional[str]:
+    """Extract namespace from manifest metadata."""
+    metadata = get_metadata(manifest)
+    namespace = metadata.get(_F_NAMESPACE)
+    return str(namespace) if type(namespace) is _S else None
+
+
+def get_spec(manifest: K8sObject) -> Dict[str, Any]:
+    """Extract spec from a manifest."""
+    spec = manifest.get(_F_SPEC)
+    return spec if type(spec) is _D else {}
+
+
+def get_pod_spec(manifest: K8sObject) -> Dict[str, Any]:
+    """Extract pod spec from various workload types."""
+    spec = get_spec(manifest)
     
-    @staticmethod
-    def get_metadata(manifest: K8sObject) -> Dict[str, Any]:
-        """Extract metadata from a manifest."""
-        metadata = manifest.get(K8sFields.METADATA)
-        return metadata if isinstance(metadata, dict) else {}
+    # Handle CronJob -> JobTemplate -> Template -> Spec
+    job_template = spec.get(_F_JOB_TEMPLATE)
+    if type(job_template) is _D:
+        job_spec = job_template.get(_F_SPEC)
+        if type(job_spec) is _D:
+            template = job_spec.get(_F_TEMPLATE)
+            if type(template) is _D:
+                template_spec = template.get(_F_SPEC)
+                if type(template_spec) is _D:
+                    return template_spec
     
-    @staticmethod
-    def get_manifest_name(manifest: K8sObject) -> str:
-        """Extract name from manifest metadata."""
-        metadata = ManifestTraverser.get_metadata(manifest)
-        name = metadata.get(K8sFields.NAME)
-        return str(name) if isinstance(name, str) else ""
+    # Handle standard workloads: Template -> Spec
+    template = spec.get(_F_TEMPLATE)
+    if type(template) is _D:
+        template_spec = template.get(_F_SPEC)
+        if type(template_spec) is _D:
+            return template_spec
     
-    @staticmethod
-    def get_manifest_namespace(manifest: K8sObject) -> Optional[str]:
-        """Extract namespace from manifest metadata."""
-        metadata = ManifestTraverser.get_metadata(manifest)
-        namespace = metadata.get(K8sFields.NAMESPACE)
-        return str(namespace) if isinstance(namespace, str) else None
+    # For bare pods or Job specs
+    return spec
+
+
+def get_pod_labels(manifest: K8sObject) -> Dict[str, str]:
+    """Extract labels from pod template metadata."""
+    spec = get_spec(manifest)
     
-    @staticmethod
-    def get_spec(manifest: K8sObject) -> Dict[str, Any]:
-        """Extract spec from a manifest."""
-        spec = manifest.get(K8sFields.SPEC)
-        return spec if isinstance(spec, dict) else {}
+    # Handle CronJob path
+    job_template = spec.get(_F_JOB_TEMPLATE)
+    if type(job_template) is _D:
+        job_spec = job_template.get(_F_SPEC)
+        if type(job_spec) is _D:
+            template = job_spec.get(_F_TEMPLATE)
+            if type(template) is _D:
+                return _extract_labels_from_template(template)
     
-    @staticmethod
-    def get_pod_spec(manifest: K8sObject) -> Dict[str, Any]:
-        """Extract pod spec from various workload types."""
-        spec = ManifestTraverser.get_spec(manifest)
-        
-        # Handle CronJob -> JobTemplate -> Template -> Spec
-        job_template = spec.get(K8sFields.JOB_TEMPLATE)
-        if isinstance(job_template, dict):
-            job_spec = job_template.get(K8sFields.SPEC)
-            if isinstance(job_spec, dict):
-                template = job_spec.get(K8sFields.TEMPLATE)
-                if isinstance(template, dict):
-                    template_spec = template.get(K8sFields.SPEC)
-                    if isinstance(template_spec, dict):
-                        return template_spec
-        
-        # Handle standard workloads: Template -> Spec
-        template = spec.get(K8sFields.TEMPLATE)
-        if isinstance(template, dict):
-            template_spec = template.get(K8sFields.SPEC)
-            if isinstance(template_spec, dict):
-                return template_spec
-        
-        # For bare pods or Job specs
-        return spec
+    # Handle standard workloads
+    template = spec.get(_F_TEMPLATE)
+    if type(template) is _D:
+        return _extract_labels_from_template(template)
     
-    @staticmethod
-    def get_pod_labels(manifest: K8sObject) -> Dict[str, str]:
-        """Extract labels from pod template metadata."""
-        spec = ManifestTraverser.get_spec(manifest)
-        
-        # Handle CronJob path
-        job_template = spec.get(K8sFields.JOB_TEMPLATE)
-        if isinstance(job_template, dict):
-            job_spec = job_template.get(K8sFields.SPEC)
-            if isinstance(job_spec, dict):
-                template = job_spec.get(K8sFields.TEMPLATE)
-                if isinstance(template, dict):
-                    return ManifestTraverser._extract_labels_from_template(template)
-        
-        # Handle standard workloads
-        template = spec.get(K8sFields.TEMPLATE)
-        if isinstance(template, dict):
-            return ManifestTraverser._extract_labels_from_template(template)
-        
+    return {}
+
+
+def _extract_labels_from_template(template: Dict[str, Any]) -> Dict[str, str]:
+    """Extract labels from a pod template."""
+    metadata = template.get(_F_METADATA)
+    if type(metadata) is not _D:
         return {}
     
-    @staticmethod
-    def _extract_labels_from_template(template: Dict[str, Any]) -> Dict[str, str]:
-        """Extract labels from a pod template."""
-        metadata = template.get(K8sFields.METADATA)
-        if not isinstance(metadata, dict):
-            return {}
-        
-        labels = metadata.get(K8sFields.LABELS)
-        if not isinstance(labels, dict):
-            return {}
-        
-        # Filter to string keys and values only
-        clean_labels: Dict[str, str] = {}
-        for key, value in labels.items():
-            if isinstance(key, str) and isinstance(value, str):
-                clean_labels[key] = value
-        
-        return clean_labels
-    
-    @staticmethod
-    def get_containers(pod_spec: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
-        """Iterate over all containers in a pod spec."""
-        for container_type in [K8sFields.CONTAINERS, K8sFields.INIT_CONTAINERS, K8sFields.EPHEMERAL_CONTAINERS]:
-            containers = pod_spec.get(container_type)
-            if isinstance(containers, list):
-                for container in containers:
-                    if isinstance(container, dict):
-                        yield container
+    labels = metadata.get(_F_LABELS)
+    if type(labels) is not _D:
+        return {}
     
-    @staticmethod
-    def get_replica_count(manifest: K8sObject) -> int:
-        """Extract replica count from a workload manifest."""
-        spec = ManifestTraverser.get_spec(manifest)
-        replicas = spec.get(K8sFields.REPLICAS)
-        return int(replicas) if isinstance(replicas, int) else 1
+    # Filter to string keys and values only
+    clean_labels: Dict[str, str] = {}
+    for key, value in labels.items():
+        if type(key) is _S and type(value) is _S:
+            clean_labels[key] = value
     
-    @staticmethod
-    def get_schedule(manifest: K8sObject) -> Optional[str]:
-        """Extract schedule from a CronJob manifest."""
-        spec = ManifestTraverser.get_spec(manifest)
-        schedule = spec.get(K8sFields.SCHEDULE)
-        return str(schedule) if isinstance(schedule, str) else None
+    return clean_labels
+
+
+def get_containers(pod_spec: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Iterate over all containers in a pod spec."""
+    for container_type in [_F_CONTAINERS, _F_INIT_CONTAINERS, _F_EPHEMERAL_CONTAINERS]:
+        containers = pod_spec.get(container_type)
+        if type(containers) is _L:
+            for container in containers:
+                if type(container) is _D:
+                    yield container
+
+
+def get_replica_count(manifest: K8sObject) -> int:
+    """Extract replica count from a workload manifest."""
+    spec = get_spec(manifest)
+    replicas = spec.get(_F_REPLICAS)
+    return int(replicas) if isinstance(replicas, int) else 1
+
+
+def get_schedule(manifest: K8sObject) -> Optional[str]:
+    """Extract schedule from a CronJob manifest."""
+    spec = get_spec(manifest)
+    schedule = spec.get(_F_SCHEDULE)
+    return str(schedule) if type(schedule) is _S else None
+
+
+def get_completions(manifest: K8sObject) -> Optional[int]:
+    """Extract completions from a Job manifest."""
+    spec = get_spec(manifest)
+    completions = spec.get(_F_COMPLETIONS)
+    return int(completions) if isinstance(completions, int) else None
+
+
+def extract_workload_summary(manifest: K8sObject) -> WorkloadSummary:
+    """Extract the commonly read workload fields in one pass.
+
+    Callers that need several of name, namespace, replicas, schedule,
+    and completions would otherwise re-resolve metadata and spec per
+    getter; this walks each dict once.
+    """
+    metadata = manifest.get(_F_METADATA)
+    if type(metadata) is not _D:
+        metadata = {}
+    spec = manifest.get(_F_SPEC)
+    if type(spec) is not _D:
+        spec = {}
     
-    @staticmethod
-    def get_completions(manifest: K8sObject) -> Optional[int]:
-        """Extract completions from a Job manifest."""
-        spec = ManifestTraverser.get_spec(manifest)
-        completions = spec.get(K8sFields.COMPLETIONS)
-        return int(completions) if isinstance(completions, int) else None
+    name = metadata.get(_F_NAME)
+    namespace = metadata.get(_F_NAMESPACE)
+    replicas = spec.get(_F_REPLICAS)
+    schedule = spec.get(_F_SCHEDULE)
+    completions = spec.get(_F_COMPLETIONS)
+    return WorkloadSummary(
+        name=name if type(name) is _S else "",
+        namespace=namespace if type(namespace) is _S else None,
+        replicas=int(replicas) if isinstance(replicas, int) else 1,
+        schedule=schedule if type(schedule) is _S else None,
+        completions=int(completions) if isinstance(completions, int) else None,
+    )
 
 
-class ResourceReferenceExtractor:
-    """Extract references to other resources from manifests."""
+def collect_pod_specs(manifests: List[K8sObject]) -> List[Dict[str, Any]]:
+    """Walk each workload's template chain once.
+
+    The extractors below all start from the same pod specs; callers
+    running several of them over one manifest list can precompute the
+    specs here and pass them in, instead of re-walking the
+    CronJob -> jobTemplate -> template chain per extractor.
+    """
+    return [get_pod_spec(manifest) for manifest in manifests]
+
+
+def extract_configmap_references(
+    manifests: List[K8sObject],
+    pod_specs: Optional[List[Dict[str, Any]]] = None,
+) -> Set[str]:
+    """Extract all ConfigMap references from a list of manifests."""
+    names: Set[str] = set()
     
-    @staticmethod
-    def extract_configmap_references(manifests: List[K8sObject]) -> Set[str]:
-        """Extract all ConfigMap references from a list of manifests."""
-        names: Set[str] = set()
-        
-        for manifest in manifests:
-            pod_spec = ManifestTraverser.get_pod_spec(manifest)
-            
-            # From volumes
-            volumes = pod_spec.get(K8sFields.VOLUMES)
-            if isinstance(volumes, list):
-                for volume in volumes:
-                    if isinstance(volume, dict):
-                        names.update(ResourceReferenceExtractor._configmaps_from_volume(volume))
-            
-            # From containers
-            for container in ManifestTraverser.get_containers(pod_spec):
-                names.update(ResourceReferenceExtractor._configmaps_from_container(container))
-        
-        return names
+    if pod_specs is None:
+        pod_specs = collect_pod_specs(manifests)
+    # Bind the loop-invariant lookups once; inside the per-manifest
+    # loop they resolve as locals instead of module globals. The
+    # per-volume and per-container walks are inlined here so each hit
+    # lands in the accumulator directly -- no helper call and no
+    # throwaway set per volume or container; the only set allocated is
+    # the one returned, once per call.
+    volumes_key = _F_VOLUMES
+    cm_key = _F_CONFIG_MAP
+    projected_key = _F_PROJECTED
+    sources_key = _F_SOURCES
+    name_key = _F_NAME
+    env_from_key = _F_ENV_FROM
+    cm_ref_key = _F_CONFIG_MAP_REF
+    env_key = _F_ENV
+    value_from_key = _F_VALUE_FROM
+    cm_key_ref_key = _F_CONFIG_MAP_KEY_REF
+    add = names.add
+    for pod_spec in pod_specs:
+        # From volumes: direct configMap and projected sources
+        volumes = pod_spec.get(volumes_key)
+        if type(volumes) is _L:
+            for volume in volumes:
+                if type(volume) is not _D:
+                    continue
+                config_map = volume.get(cm_key)
+                if type(config_map) is _D:
+                    name = config_map.get(name_key)
+                    if type(name) is _S:
+                        add(name)
+                projected = volume.get(projected_key)
+                if type(projected) is _D:
+                    sources = projected.get(sources_key)
+                    if type(sources) is _L:
+                        for source in sources:
+                            if type(source) is _D:
+                                ref = source.get(cm_key)
+                                if type(ref) is _D:
+                                    name = ref.get(name_key)
+                                    if type(name) is _S:
+                                        add(name)
+        
+        # From containers: envFrom and env valueFrom
+        for container in get_containers(pod_spec):
+            env_from = container.get(env_from_key)
+            if type(env_from) is _L:
+                for entry in env_from:
+                    if type(entry) is _D:
+                        ref = entry.get(cm_ref_key)
+                        if type(ref) is _D:
+                            name = ref.get(name_key)
+                            if type(name) is _S:
+                                add(name)
+            env = container.get(env_key)
+            if type(env) is _L:
+                for entry in env:
+                    if type(entry) is _D:
+                        value_from = entry.get(value_from_key)
+                        if type(value_from) is _D:
+                            config_ref = value_from.get(cm_key_ref_key)
+                            if type(config_ref) is _D:
+                                name = config_ref.get(name_key)
+                                if type(name) is _S:
+                                    add(name)
     
-    @staticmethod
-    def _configmaps_from_volume(volume: Dict[str, Any]) -> Set[str]:
-        """Extract ConfigMap names from a volume definition."""
-        names: Set[str] = set()
-        
-        # Direct configMap reference
-        config_map = volume.get(K8sFields.CONFIG_MAP)
-        if isinstance(config_map, dict):
-            name = config_map.get(K8sFields.NAME)
-            if isinstance(name, str):
-                names.add(name)
-        
-        # Projected volumes
-        projected = volume.get(K8sFields.PROJECTED)
-        if isinstance(projected, dict):
-            sources = projected.get(K8sFields.SOURCES)
-            if isinstance(sources, list):
-                for source in sources:
-                    if isinstance(source, dict):
-                        ref = source.get(K8sFields.CONFIG_MAP)
-                        if isinstance(ref, dict):
-                            name = ref.get(K8sFields.NAME)
-                            if isinstance(name, str):
-                                names.add(name)
-        
-        return names
+    return names
+
+
+def extract_secret_references(
+    manifests: List[K8sObject],
+    pod_specs: Optional[List[Dict[str, Any]]] = None,
+) -> Set[str]:
+    """Extract all Secret references from a list of manifests."""
+    names: Set[str] = set()
     
-    @staticmethod
-    def _configmaps_from_container(container: Dict[str, Any]) -> Set[str]:
-        """Extract ConfigMap names from a container definition."""
-        names: Set[str] = set()
-        
-        # From envFrom
-        env_from = container.get(K8sFields.ENV_FROM)
-        if isinstance(env_from, list):
-            for entry in env_from:
-                if isinstance(entry, dict):
-                    ref = entry.get(K8sFields.CONFIG_MAP_REF)
-                    if isinstance(ref, dict):
-                        name = ref.get(K8sFields.NAME)
-                        if isinstance(name, str):
-                            names.add(name)
-        
-        # From env valueFrom
-        env = container.get(K8sFields.ENV)
-        if isinstance(env, list):
-            for entry in env:
-                if isinstance(entry, dict):
-                    value_from = entry.get(K8sFields.VALUE_FROM)
-                    if isinstance(value_from, dict):
-                        config_ref = value_from.get(K8sFields.CONFIG_MAP_KEY_REF)
-                        if isinstance(config_ref, dict):
-                            name = config_ref.get(K8sFields.NAME)
-                            if isinstance(name, str):
-                                names.add(name)
-        
-        return names
+    if pod_specs is None:
+        pod_specs = collect_pod_specs(manifests)
+    # Same inlined, local-bound layout as the configmap extractor.
+    volumes_key = _F_VOLUMES
+    pull_secrets_key = _F_IMAGE_PULL_SECRETS
+    secret_key = _F_SECRET
+    secret_name_key = _F_SECRET_NAME
+    projected_key = _F_PROJECTED
+    sources_key = _F_SOURCES
+    name_key = _F_NAME
+    env_from_key = _F_ENV_FROM
+    secret_ref_key = _F_SECRET_REF
+    env_key = _F_ENV
+    value_from_key = _F_VALUE_FROM
+    secret_key_ref_key = _F_SECRET_KEY_REF
+    add = names.add
+    for pod_spec in pod_specs:
+        # From volumes: direct secret and projected sources
+        volumes = pod_spec.get(volumes_key)
+        if type(volumes) is _L:
+            for volume in volumes:
+                if type(volume) is not _D:
+                    continue
+                secret = volume.get(secret_key)
+                if type(secret) is _D:
+                    name = secret.get(secret_name_key) or secret.get(name_key)
+                    if type(name) is _S:
+                        add(name)
+                projected = volume.get(projected_key)
+                if type(projected) is _D:
+                    sources = projected.get(sources_key)
+                    if type(sources) is _L:
+                        for source in sources:
+                            if type(source) is _D:
+                                ref = source.get(secret_key)
+                                if type(ref) is _D:
+                                    name = ref.get(name_key)
+                                    if type(name) is _S:
+                                        add(name)
+        
+        # From imagePullSecrets
+        image_pull_secrets = pod_spec.get(pull_secrets_key)
+        if type(image_pull_secrets) is _L:
+            for pull_secret in image_pull_secrets:
+                if type(pull_secret) is _D:
+                    name = pull_secret.get(name_key)
+                    if type(name) is _S:
+                        add(name)
+        
+        # From containers: envFrom and env valueFrom
+        for container in get_containers(pod_spec):
+            env_from = container.get(env_from_key)
+            if type(env_from) is _L:
+                for entry in env_from:
+                    if type(entry) is _D:
+                        ref = entry.get(secret_ref_key)
+                        if type(ref) is _D:
+                            name = ref.get(name_key)
+                            if type(name) is _S:
+                                add(name)
+            env = container.get(env_key)
+            if type(env) is _L:
+                for entry in env:
+                    if type(entry) is _D:
+                        value_from = entry.get(value_from_key)
+                        if type(value_from) is _D:
+                            secret_ref = value_from.get(secret_key_ref_key)
+                            if type(secret_ref) is _D:
+                                name = secret_ref.get(name_key)
+                                if type(name) is _S:
+                                    add(name)
     
-    @staticmethod
-    def extract_secret_references(manifests: List[K8sObject]) -> Set[str]:
-        """Extract all Secret references from a list of manifests."""
-        names: Set[str] = set()
-        
-        for manifest in manifests:
-            pod_spec = ManifestTraverser.get_pod_spec(manifest)
-            
-            # From volumes
-            volumes = pod_spec.get(K8sFields.VOLUMES)
-            if isinstance(volumes, list):
-                for volume in volumes:
-                    if isinstance(volume, dict):
-                        names.update(ResourceReferenceExtractor._secrets_from_volume(volume))
-            
-            # From imagePullSecrets
-            image_pull_secrets = pod_spec.get(K8sFields.IMAGE_PULL_SECRETS)
-            if isinstance(image_pull_secrets, list):
-                for pull_secret in image_pull_secrets:
-                    if isinstance(pull_secret, dict):
-                        name = pull_secret.get(K8sFields.NAME)
-                        if isinstance(name, str):
-                            names.add(name)
-            
-            # From containers
-            for container in ManifestTraverser.get_containers(pod_spec):
-                names.update(ResourceReferenceExtractor._secrets_from_container(container))
-        
-        return names
+    return names
+
+
+def extract_service_account_references(
+    manifests: List[K8sObject],
+    pod_specs: Optional[List[Dict[str, Any]]] = None,
+) -> Set[str]:
+    """Extract ServiceAccount references from manifests."""
+    names: Set[str] = set()
     
-    @staticmethod
-    def _secrets_from_volume(volume: Dict[str, Any]) -> Set[str]:
-        """Extract Secret names from a volume definition."""
-        names: Set[str] = set()
-        
-        # Direct secret reference
-        secret = volume.get(K8sFields.SECRET)
-        if isinstance(secret, dict):
-            name = secret.get(K8sFields.SECRET_NAME) or secret.get(K8sFields.NAME)
-            if isinstance(name, str):
-                names.add(name)
-        
-        # Projected volumes
-        projected = volume.get(K8sFields.PROJECTED)
-        if isinstance(projected, dict):
-            sources = projected.get(K8sFields.SOURCES)
-            if isinstance(sources, list):
-                for source in sources:
-                    if isinstance(source, dict):
-                        ref = source.get(K8sFields.SECRET)
-                        if isinstance(ref, dict):
-                            name = ref.get(K8sFields.NAME)
-                            if isinstance(name, str):
-                                names.add(name)
-        
-        return names
+    if pod_specs is None:
+        pod_specs = collect_pod_specs(manifests)
+    for pod_spec in pod_specs:
+        service_account = (
+            pod_spec.get(_F_SERVICE_ACCOUNT_NAME) or 
+            pod_spec.get(_F_SERVICE_ACCOUNT)
+        )
+        if type(service_account) is _S and service_account:
+            names.add(service_account)
     
-    @staticmethod
-    def _secrets_from_container(container: Dict[str, Any]) -> Set[str]:
-        """Extract Secret names from a container definition."""
-        names: Set[str] = set()
-        
-        # From envFrom
-        env_from = container.get(K8sFields.ENV_FROM)
-        if isinstance(env_from, list):
-            for entry in env_from:
-                if isinstance(entry, dict):
-                    ref = entry.get(K8sFields.SECRET_REF)
-                    if isinstance(ref, dict):
-                        name = ref.get(K8sFields.NAME)
-                        if isinstance(name, str):
+    return names
+
+
+def extract_pvc_references(
+    manifests: List[K8sObject],
+    pod_specs: Optional[List[Dict[str, Any]]] = None,
+) -> Set[str]:
+    """Extract PersistentVolumeClaim references from manifests."""
+    names: Set[str] = set()
+    
+    if pod_specs is None:
+        pod_specs = collect_pod_specs(manifests)
+    for pod_spec in pod_specs:
+        volumes = pod_spec.get(_F_VOLUMES)
+        if type(volumes) is _L:
+            for volume in volumes:
+                if type(volume) is _D:
+                    claim = volume.get(_F_PERSISTENT_VOLUME_CLAIM)
+                    if type(claim) is _D:
+                        name = claim.get(_F_CLAIM_NAME) or claim.get(_F_NAME)
+                        if type(name) is _S and name:
                             names.add(name)
-        
-        # From env valueFrom
-        env = container.get(K8sFields.ENV)
-        if isinstance(env, list):
-            for entry in env:
-                if isinstance(entry, dict):
-                    value_from = entry.get(K8sFields.VALUE_FROM)
-                    if isinstance(value_from, dict):
-                        secret_ref = value_from.get(K8sFields.SECRET_KEY_REF)
-                        if isinstance(secret_ref, dict):
-                            name = secret_ref.get(K8sFields.NAME)
-                            if isinstance(name, str):
-                                names.add(name)
-        
-        return names
     
-    @staticmethod
-    def extract_service_account_references(manifests: List[K8sObject]) -> Set[str]:
-        """Extract ServiceAccount references from manifests."""
-        names: Set[str] = set()
-        
-        for manifest in manifests:
-            pod_spec = ManifestTraverser.get_pod_spec(manifest)
-            service_account = (
-                pod_spec.get(K8sFields.SERVICE_ACCOUNT_NAME) or 
-                pod_spec.get(K8sFields.SERVICE_ACCOUNT)
-            )
-            if isinstance(service_account, str) and service_account:
-                names.add(service_account)
-        
-        return names
+    return names
+
+
+def extract_all_references(
+    manifests: List[K8sObject],
+    pod_specs: Optional[List[Dict[str, Any]]] = None,
+) -> Dict[str, Set[str]]:
+    """Extract every reference kind from a list of manifests in one walk.
+
+    The per-kind extractors above each traverse the full volume and
+    container chains; callers that need several kinds pay that pointer
+    chasing once per kind. This fused walk visits each volume and
+    container exactly once and fans the hits out to all four result
+    sets, keyed by resource type.
+    """
+    configmaps: Set[str] = set()
+    secrets: Set[str] = set()
+    service_accounts: Set[str] = set()
+    pvcs: Set[str] = set()
+
+    if pod_specs is None:
+        pod_specs = collect_pod_specs(manifests)
+    volumes_key = _F_VOLUMES
+    cm_key = _F_CONFIG_MAP
+    secret_key = _F_SECRET
+    secret_name_key = _F_SECRET_NAME
+    pvc_key = _F_PERSISTENT_VOLUME_CLAIM
+    claim_name_key = _F_CLAIM_NAME
+    projected_key = _F_PROJECTED
+    sources_key = _F_SOURCES
+    name_key = _F_NAME
+    pull_secrets_key = _F_IMAGE_PULL_SECRETS
+    sa_name_key = _F_SERVICE_ACCOUNT_NAME
+    sa_key = _F_SERVICE_ACCOUNT
+    env_from_key = _F_ENV_FROM
+    cm_ref_key = _F_CONFIG_MAP_REF
+    secret_ref_key = _F_SECRET_REF
+    env_key = _F_ENV
+    value_from_key = _F_VALUE_FROM
+    cm_key_ref_key = _F_CONFIG_MAP_KEY_REF
+    secret_key_ref_key = _F_SECRET_KEY_REF
+    add_configmap = configmaps.add
+    add_secret = secrets.add
+    add_pvc = pvcs.add
+    for pod_spec in pod_specs:
+        # From volumes: configMap, secret, PVC, and projected sources
+        volumes = pod_spec.get(volumes_key)
+        if type(volumes) is _L:
+            for volume in volumes:
+                if type(volume) is not _D:
+                    continue
+                config_map = volume.get(cm_key)
+                if type(config_map) is _D:
+                    name = config_map.get(name_key)
+                    if type(name) is _S:
+                        add_configmap(name)
+                secret = volume.get(secret_key)
+                if type(secret) is _D:
+                    name = secret.get(secret_name_key) or secret.get(name_key)
+                    if type(name) is _S:
+                        add_secret(name)
+                claim = volume.get(pvc_key)
+                if type(claim) is _D:
+                    name = claim.get(claim_name_key) or claim.get(name_key)
+                    if type(name) is _S and name:
+                        add_pvc(name)
+                projected = volume.get(projected_key)
+                if type(projected) is _D:
+                    sources = projected.get(sources_key)
+                    if type(sources) is _L:
+                        for source in sources:
+                            if type(source) is not _D:
+                                continue
+                            ref = source.get(cm_key)
+                            if type(ref) is _D:
+                                name = ref.get(name_key)
+                                if type(name) is _S:
+                                    add_configmap(name)
+                            ref = source.get(secret_key)
+                            if type(ref) is _D:
+                                name = ref.get(name_key)
+                                if type(name) is _S:
+                                    add_secret(name)
+
+        # From imagePullSecrets
+        image_pull_secrets = pod_spec.get(pull_secrets_key)
+        if type(image_pull_secrets) is _L:
+            for pull_secret in image_pull_secrets:
+                if type(pull_secret) is _D:
+                    name = pull_secret.get(name_key)
+                    if type(name) is _S:
+                        add_secret(name)
+
+        # From the pod spec itself: service account
+        service_account = pod_spec.get(sa_name_key) or pod_spec.get(sa_key)
+        if type(service_account) is _S and service_account:
+            service_accounts.add(service_account)
+
+        # From containers: envFrom and env valueFrom hit both kinds
+        for container in get_containers(pod_spec):
+            env_from = container.get(env_from_key)
+            if type(env_from) is _L:
+                for entry in env_from:
+                    if type(entry) is not _D:
+                        continue
+                    ref = entry.get(cm_ref_key)
+                    if type(ref) is _D:
+                        name = ref.get(name_key)
+                        if type(name) is _S:
+                            add_configmap(name)
+                    ref = entry.get(secret_ref_key)
+                    if type(ref) is _D:
+                        name = ref.get(name_key)
+                        if type(name) is _S:
+                            add_secret(name)
+            env = container.get(env_key)
+            if type(env) is _L:
+                for entry in env:
+                    if type(entry) is not _D:
+                        continue
+                    value_from = entry.get(value_from_key)
+                    if type(value_from) is not _D:
+                        continue
+                    ref = value_from.get(cm_key_ref_key)
+                    if type(ref) is _D:
+                        name = ref.get(name_key)
+                        if type(name) is _S:
+                            add_configmap(name)
+                    ref = value_from.get(secret_key_ref_key)
+                    if type(ref) is _D:
+                        name = ref.get(name_key)
+                        if type(name) is _S:
+                            add_secret(name)
+
+    return {
+        ResourceTypes.CONFIG_MAPS: configmaps,
+        ResourceTypes.SECRETS: secrets,
+        ResourceTypes.SERVICE_ACCOUNTS: service_accounts,
+        ResourceTypes.PERSISTENT_VOLUME_CLAIMS: pvcs,
+    }
+
+
+def find_matching_services(
+    workloads: List[K8sObject], 
+    services: List[K8sObject]
+) -> Set[str]:
+    """Find services that match workload selectors."""
+    matches: Set[str] = set()
     
-    @staticmethod
-    def extract_pvc_references(manifests: List[K8sObject]) -> Set[str]:
-        """Extract PersistentVolumeClaim references from manifests."""
-        names: Set[str] = set()
-        
-        for manifest in manifests:
-            pod_spec = ManifestTraverser.get_pod_spec(manifest)
-            volumes = pod_spec.get(K8sFields.VOLUMES)
-            if isinstance(volumes, list):
-                for volume in volumes:
-                    if isinstance(volume, dict):
-                        claim = volume.get(K8sFields.PERSISTENT_VOLUME_CLAIM)
-                        if isinstance(claim, dict):
-                            name = claim.get(K8sFields.CLAIM_NAME) or claim.get(K8sFields.NAME)
-                            if isinstance(name, str) and name:
-                                names.add(name)
-        
-        return names
+    # Pod labels per workload are loop-invariant across services, so
+    # compute them once up front instead of once per (service, workload)
+    # pair.
+    workload_labels = [
+        labels for workload in workloads if (labels := get_pod_labels(workload))
+    ]
     
-    @staticmethod
-    def find_matching_services(
-        workloads: List[K8sObject], 
-        services: List[K8sObject]
-    ) -> Set[str]:
-        """Find services that match workload selectors."""
-        matches: Set[str] = set()
-        
-        for service in services:
-            service_spec = ManifestTraverser.get_spec(service)
-            selector = service_spec.get(K8sFields.SELECTOR)
-            if not isinstance(selector, dict) or not selector:
-                continue
-            
-            for workload in workloads:
-                labels = ManifestTraverser.get_pod_labels(workload)
-                if labels and all(labels.get(key) == value for key, value in selector.items()):
-                    name = ManifestTraverser.get_manifest_name(service)
-                    if name:
-                        matches.add(name)
-                    break
-        
-        return matches
+    # Inverted index from (key, value) label pairs to workload indices.
+    # Each selector then scans only the workloads carrying its rarest
+    # pair instead of every workload, turning the quadratic
+    # service x workload sweep into O(services + candidate checks).
+    label_index: Dict[Tuple[str, str], List[int]] = {}
+    for index, labels in enumerate(workload_labels):
+        for item in labels.items():
+            label_index.setdefault(item, []).append(index)
     
-    @staticmethod
-    def find_ingresses_for_services(
-        ingresses: List[K8sObject], 
-        service_names: Set[str]
-    ) -> Set[str]:
-        """Find ingresses that reference the given services."""
-        if not service_names:
-            return set()
-        
-        matches: Set[str] = set()
-        
-        for ingress in ingresses:
-            referenced_services = ResourceReferenceExtractor._extract_services_from_ingress(ingress)
-            if referenced_services.intersection(service_names):
-                name = ManifestTraverser.get_manifest_name(ingress)
+    for service in services:
+        service_spec = get_spec(service)
+        selector = service_spec.get(_F_SELECTOR)
+        if type(selector) is not _D or not selector:
+            continue
+        
+        selector_items = list(selector.items())
+        pivot = min(selector_items, key=lambda kv: len(label_index.get(kv, ())))
+        for index in label_index.get(pivot, ()):
+            labels = workload_labels[index]
+            if all(labels.get(key) == value for key, value in selector_items):
+                name = get_manifest_name(service)
                 if name:
                     matches.add(name)
-        
-        return matches
+                break
     
-    @staticmethod
-    def _extract_services_from_ingress(ingress: K8sObject) -> Set[str]:
-        """Extract service names referenced by an ingress."""
-        names: Set[str] = set()
-        spec = ManifestTraverser.get_spec(ingress)
-        
-        # Default backend
-        default_backend = spec.get(K8sFields.DEFAULT_BACKEND)
-        names.update(ResourceReferenceExtractor._services_from_backend(default_backend))
-        
-        # Rules
-        rules = spec.get(K8sFields.RULES)
-        if isinstance(rules, list):
-            for rule in rules:
-                if isinstance(rule, dict):
-                    http = rule.get(K8sFields.HTTP)
-                    if isinstance(http, dict):
-                        paths = http.get(K8sFields.PATHS)
-                        if isinstance(paths, list):
-                            for path in paths:
-                                if isinstance(path, dict):
-                                    backend = path.get(K8sFields.BACKEND)
-                                    names.update(ResourceReferenceExtractor._services_from_backend(backend))
-        
-        return names
+    return matches
+
+
+def find_ingresses_for_services(
+    ingresses: List[K8sObject], 
+    service_names: Set[str]
+) -> Set[str]:
+    """Find ingresses that reference the given services."""
+    if not service_names:
+        return set()
     
-    @staticmethod
-    def _services_from_backend(backend: Any) -> Set[str]:
-        """Extract service names from an ingress backend."""
-        names: Set[str] = set()
-        if not isinstance(backend, dict):
-            return names
-        
-        # New format
-        service = backend.get(K8sFields.SERVICE)
-        if isinstance(service, dict):
-            name = service.get(K8sFields.NAME)
-            if isinstance(name, str) and name:
-                names.add(name)
-        
-        # Legacy format
-        legacy_name = backend.get(K8sFields.SERVICE_NAME)
-        if isinstance(legacy_name, str) and legacy_name:
-            names.add(legacy_name)
-        
-        return names
+    matches: Set[str] = set()
+    
+    for ingress in ingresses:
+        if _ingress_references_any(ingress, service_names):
+            name = get_manifest_name(ingress)
+            if name:
+                matches.add(name)
+    
+    return matches
+
+
+def _ingress_references_any(ingress: K8sObject, target: Set[str]) -> bool:
+    """Check whether an ingress routes to any of the target services.
+
+    Walks the backends and returns on the first hit rather than
+    collecting every referenced name into a set just to intersect it;
+    large ingresses mostly produced names that were thrown away.
+    """
+    backend_hits = _backend_references_any
+    spec = get_spec(ingress)
+    
+    # Default backend
+    if backend_hits(spec.get(_F_DEFAULT_BACKEND), target):
+        return True
+    
+    # Rules
+    rules = spec.get(_F_RULES)
+    if type(rules) is _L:
+        for rule in rules:
+            if type(rule) is _D:
+                http = rule.get(_F_HTTP)
+                if type(http) is _D:
+                    paths = http.get(_F_PATHS)
+                    if type(paths) is _L:
+                        for path in paths:
+                            if type(path) is _D:
+                                if backend_hits(path.get(_F_BACKEND), target):
+                                    return True
+    
+    return False
+
+
+def _backend_references_any(backend: Any, target: Set[str]) -> bool:
+    """Check whether an ingress backend points at a target service."""
+    if type(backend) is not _D:
+        return False
+    
+    # New format
+    service = backend.get(_F_SERVICE)
+    if type(service) is _D:
+        name = service.get(_F_NAME)
+        if type(name) is _S and name in target:
+            return True
+    
+    # Legacy format
+    legacy_name = backend.get(_F_SERVICE_NAME)
+    return type(legacy_name) is _S and legacy_name in target
+
+
+class ManifestTraverser:
+    """Utility for traversing Kubernetes manifest structures.
+
+    Thin compatibility wrapper: the traversal functions live at module
+    level so internal callers skip the class-attribute and staticmethod
+    descriptor lookups per call.
+    """
+    
+    get_metadata = staticmethod(get_metadata)
+    get_manifest_name = staticmethod(get_manifest_name)
+    get_manifest_namespace = staticmethod(get_manifest_namespace)
+    get_spec = staticmethod(get_spec)
+    get_pod_spec = staticmethod(get_pod_spec)
+    get_pod_labels = staticmethod(get_pod_labels)
+    get_containers = staticmethod(get_containers)
+    get_replica_count = staticmethod(get_replica_count)
+    get_schedule = staticmethod(get_schedule)
+    get_completions = staticmethod(get_completions)
+    extract_workload_summary = staticmethod(extract_workload_summary)
+
+
+class ResourceReferenceExtractor:
+    """Extract references to other resources from manifests.
+
+    Thin compatibility wrapper over the module-level functions, matching
+    ManifestTraverser above.
+    """
+    
+    collect_pod_specs = staticmethod(collect_pod_specs)
+    extract_configmap_references = staticmethod(extract_configmap_references)
+    extract_secret_references = staticmethod(extract_secret_references)
+    extract_service_account_references = staticmethod(extract_service_account_references)
+    extract_pvc_references = staticmethod(extract_pvc_references)
+    extract_all_references = staticmethod(extract_all_references)
+    find_matching_services = staticmethod(find_matching_services)
+    find_ingresses_for_services = staticmethod(find_ingresses_for_services)
+
+
+# Translation table for slugify: ASCII [a-z0-9-.] pass through, every
+# other ASCII code point maps to "-". str.translate applies it entirely
+# in C -- table-indexed classification with no per-character branches,
+# replacing the per-character Python loop.
+_SLUG_KEEP = "abcdefghijklmnopqrstuvwxyz0123456789-."
+_SLUG_TABLE = {code: code if chr(code) in _SLUG_KEEP else 45 for code in range(128)}
 
 
 def slugify(value: str) -> str:
     """Convert a string to a filesystem-safe slug."""
+    lowered = value.lower()
+    if lowered.isascii():
+        return lowered.translate(_SLUG_TABLE).strip("-")
+    # Non-ASCII input: isalnum accepts characters the table doesn't cover,
+    # so keep the original per-character path for correctness.
     allowed = []
-    for char in value.lower():
+    for char in lowered:
         if char.isalnum() or char in {"-", "."}:
             allowed.append(char)
         else:
             allowed.append("-")
-    slug = "".join(allowed).strip("-")
-    return slug
+    return "".join(allowed).strip("-")
+
+
+def truncate_many(texts: List[str], width: int) -> List[str]:
+    """Truncate a batch of strings to fit within a given width.
+
+    Computes the width-derived locals once and runs a single list
+    comprehension, instead of one truncate call per row; useful for
+    table-style output where every row shares the width.
+    """
+    if width <= 0:
+        return ["" for _ in texts]
+    if width == 1:
+        return [text if len(text) <= 1 else text[:1] for text in texts]
+    cut = width - 1
+    return [text if len(text) <= width else text[:cut] + "…" for text in texts]
 
 
 class StringUtils:
     """String utility functions."""
-    
+
     slugify = staticmethod(slugify)
-    
+    truncate_many = staticmethod(truncate_many)
+
     @staticmethod
     def truncate(text: str, width: int) -> str:
         """Truncate text to fit within a given width."""
@@ -461,6 +774,11 @@ class StringUtils:
         return text[: width - 1] + "…"
 
 
+# Delays for the default backoff parameters, clamped at build time; the
+# common retry path indexes this instead of running float __pow__.
+_BACKOFF_2 = tuple(min(2.0 ** i, 60.0) for i in range(16))
+
+
 class RetryUtils:
     """Utility functions for retry logic."""
     
@@ -471,6 +789,8 @@ class RetryUtils:
         max_delay: float = 60.0
     ) -> float:
         """Calculate exponential backoff delay."""
+        if base == 2.0 and max_delay == 60.0:
+            return _BACKOFF_2[attempt if attempt < 16 else 15]
         delay = base ** attempt
         return min(delay, max_delay)
     
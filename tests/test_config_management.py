@@ -3,27 +3,34 @@
 Test script for configuration management functionality.
 """
 
-import json
+import io
 import sys
-from pathlib import Path
-
-# Add the src directory to Python path for imports
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
 
 from rancher_helm_exporter.cli import (
-    save_config, load_config, delete_config, delete_all_configs,
+    save_all_configs, load_config, delete_config, delete_all_configs,
     list_config_names, load_all_configs
 )
 
-def test_config_management():
+def test_config_management(tmp_path, monkeypatch):
     """Test configuration save, load, and delete functionality."""
 
-    print("Testing Configuration Management")
-    print("=" * 40)
+    # Point the config directory at a per-test tmp_path so parallel
+    # workers (pytest-xdist) never race on the shared ~/.config log.
+    monkeypatch.setenv("RANCHER_HELM_EXPORTER_CONFIG_DIR", str(tmp_path))
+
+    # Diagnostic lines accumulate in one buffer and hit stdout with a
+    # single write at the end, instead of a lock-and-maybe-flush per
+    # print call.
+    buf = io.StringIO()
+    def p(line=""):
+        buf.write(line)
+        buf.write("\n")
+
+    p("Testing Configuration Management")
+    p("=" * 40)
 
     # Test 1: Save some test configurations
-    print("\n1. Creating test configurations...")
+    p("\n1. Creating test configurations...")
 
     test_configs = {
         "test-config-1": {
@@ -45,76 +52,78 @@ def test_config_management():
         }
     }
 
-    for name, config in test_configs.items():
-        save_config(name, config)
-        print(f"  [+] Saved: {name}")
-
-    # Test 2: List configurations
-    print("\n2. Listing saved configurations...")
-    config_names = list_config_names()
-    print(f"  Found {len(config_names)} configurations:")
-    for name in config_names:
-        print(f"    - {name}")
-
-    # Test 3: Load configurations
-    print("\n3. Loading and verifying configurations...")
-    for name in config_names:
-        loaded_config = load_config(name)
-        if loaded_config:
-            print(f"  [+] Loaded: {name}")
-            print(f"      Release: {loaded_config.get('release', 'N/A')}")
-            print(f"      Namespace: {loaded_config.get('namespace', 'N/A')}")
-        else:
-            print(f"  [-] Failed to load: {name}")
-
-    # Test 4: Delete a specific configuration
-    print("\n4. Testing delete specific configuration...")
-    if "old-config" in config_names:
-        if delete_config("old-config"):
-            print("  [+] Successfully deleted 'old-config'")
+    try:
+        # One bulk write instead of a read-modify-write cycle per entry
+        save_all_configs(test_configs)
+        for name in test_configs:
+            p(f"  [+] Saved: {name}")
+
+        # Test 2: List configurations
+        p("\n2. Listing saved configurations...")
+        config_names = list_config_names()
+        p(f"  Found {len(config_names)} configurations:")
+        for name in config_names:
+            p(f"    - {name}")
+
+        # Test 3: Load configurations
+        p("\n3. Loading and verifying configurations...")
+        for name in config_names:
+            loaded_config = load_config(name)
+            if loaded_config:
+                p(f"  [+] Loaded: {name}")
+                p(f"      Release: {loaded_config.get('release', 'N/A')}")
+                p(f"      Namespace: {loaded_config.get('namespace', 'N/A')}")
+            else:
+                p(f"  [-] Failed to load: {name}")
+
+        # Test 4: Delete a specific configuration
+        p("\n4. Testing delete specific configuration...")
+        if "old-config" in config_names:
+            if delete_config("old-config"):
+                p("  [+] Successfully deleted 'old-config'")
+            else:
+                p("  [-] Failed to delete 'old-config'")
+
+        # Verify deletion
+        updated_names = list_config_names()
+        p(f"  Configurations after deletion: {len(updated_names)}")
+        for name in updated_names:
+            p(f"    - {name}")
+
+        # Test 5: Show detailed config information
+        p("\n5. Configuration details with metadata...")
+        all_configs = load_all_configs()
+        for name, config_entry in all_configs.items():
+            p(f"  Config: {name}")
+            p(f"    Saved at: {config_entry.get('saved_at', 'Unknown')}")
+            actual_config = config_entry.get('config', {})
+            p(f"    Release: {actual_config.get('release', 'N/A')}")
+            p(f"    Namespace: {actual_config.get('namespace', 'N/A')}")
+
+        # Test 6: Delete all configurations
+        p("\n6. Testing delete all configurations...")
+        if updated_names:
+            p(f"  About to delete {len(updated_names)} configurations")
+            if delete_all_configs():
+                p("  [+] Successfully deleted all configurations")
+            else:
+                p("  [-] Failed to delete all configurations")
         else:
-            print("  [-] Failed to delete 'old-config'")
-
-    # Verify deletion
-    updated_names = list_config_names()
-    print(f"  Configurations after deletion: {len(updated_names)}")
-    for name in updated_names:
-        print(f"    - {name}")
-
-    # Test 5: Show detailed config information
-    print("\n5. Configuration details with metadata...")
-    all_configs = load_all_configs()
-    for name, config_entry in all_configs.items():
-        print(f"  Config: {name}")
-        print(f"    Saved at: {config_entry.get('saved_at', 'Unknown')}")
-        actual_config = config_entry.get('config', {})
-        print(f"    Release: {actual_config.get('release', 'N/A')}")
-        print(f"    Namespace: {actual_config.get('namespace', 'N/A')}")
-
-    # Test 6: Delete all configurations
-    print("\n6. Testing delete all configurations...")
-    if updated_names:
-        print(f"  About to delete {len(updated_names)} configurations")
-        if delete_all_configs():
-            print("  [+] Successfully deleted all configurations")
+            p("  No configurations to delete")
+
+        # Final verification
+        final_names = list_config_names()
+        p(f"\n7. Final verification: {len(final_names)} configurations remaining")
+        if final_names:
+            p("  Remaining configurations:")
+            for name in final_names:
+                p(f"    - {name}")
         else:
-            print("  [-] Failed to delete all configurations")
-    else:
-        print("  No configurations to delete")
-
-    # Final verification
-    final_names = list_config_names()
-    print(f"\n7. Final verification: {len(final_names)} configurations remaining")
-    if final_names:
-        print("  Remaining configurations:")
-        for name in final_names:
-            print(f"    - {name}")
-    else:
-        print("  [+] All configurations successfully deleted")
-
-    print("\n" + "=" * 40)
-    print("Configuration Management Test Complete!")
-    print("The delete functionality is working correctly.")
-
-if __name__ == "__main__":
-    test_config_management()
\ No newline at end of file
+            p("  [+] All configurations successfully deleted")
+
+        p("\n" + "=" * 40)
+        p("Configuration Management Test Complete!")
+        p("The delete functionality is working correctly.")
+    finally:
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
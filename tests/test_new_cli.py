@@ -1,171 +1,149 @@
 #!/usr/bin/env python3
 """
-Test script for the new state-based CLI application.
+Tests for the new state-based CLI application.
 """
 
-import sys
+import io
+import re
 import subprocess
+import sys
+from contextlib import redirect_stdout, redirect_stderr
+from functools import lru_cache
 from pathlib import Path
 
-def test_new_cli_structure():
-    """Test the new CLI structure and state-based flags."""
+import pytest
+
+from rancher_helm_exporter.cli import main
+
+# Resolved once for the lone subprocess case rather than per call.
+_PY = sys.executable
+_CWD = str(Path(__file__).parent.parent)
+_BASE = [_PY, "-m", "rancher_helm_exporter"]
+
+STATE_FLAGS = ["--explore", "--configs", "--bulk", "--demo", "--debug"]
+MODIFIER_FLAGS = ["--auto-detect", "--namespace-restricted", "--offline"]
+HELP_SECTIONS = ["APPLICATION MODES", "BEHAVIOR MODIFIERS", "CONFIGURATION OPTIONS"]
+
+
+def run_cli(args):
+    """Invoke the CLI in-process and capture (returncode, stdout, stderr).
 
-    print("Testing New State-Based CLI Application")
-    print("=" * 50)
+    The CLI is pure Python, so calling main() directly skips the
+    interpreter startup and package re-import that a subprocess per case
+    would pay. argparse exits via SystemExit; treat its code as the
+    process return code. stdin is swapped for an empty stream so any
+    stray prompt fails immediately instead of hanging the suite.
 
-    # Test the help output
-    print("\n1. Testing help output and argument structure...")
+    Not thread-safe: redirect_stdout/redirect_stderr and the stdin swap
+    replace process-global streams, so these invocations must stay
+    serial within a worker (parametrized cases still spread across
+    pytest-xdist workers, which are separate processes).
+    """
+    buf_out, buf_err = io.StringIO(), io.StringIO()
+    returncode = 0
+    old_stdin = sys.stdin
+    sys.stdin = io.StringIO("")
     try:
-        result = subprocess.run([
-            sys.executable, "-m", "src.rancher_helm_exporter", "--help"
-        ], capture_output=True, text=True, cwd=Path(__file__).parent)
-
-        if result.returncode == 0:
-            print("  [+] Help command successful")
-
-            # Check for new state flags
-            help_text = result.stdout
-            state_flags = ["--explore", "--configs", "--bulk", "--demo", "--debug"]
-            modifier_flags = ["--auto-detect", "--namespace-restricted", "--offline"]
-
-            print("  [+] State flags found:")
-            for flag in state_flags:
-                if flag in help_text:
-                    print(f"    [+] {flag}")
-                else:
-                    print(f"    [-] {flag} MISSING")
-
-            print("  [+] Modifier flags found:")
-            for flag in modifier_flags:
-                if flag in help_text:
-                    print(f"    [+] {flag}")
-                else:
-                    print(f"    [-] {flag} MISSING")
-
-            # Check for proper sections
-            sections = ["APPLICATION MODES", "BEHAVIOR MODIFIERS", "CONFIGURATION OPTIONS"]
-            for section in sections:
-                if section in help_text:
-                    print(f"    [+] {section} section")
-                else:
-                    print(f"    [-] {section} section MISSING")
-
-        else:
-            print(f"  [-] Help command failed: {result.stderr}")
-
-    except Exception as e:
-        print(f"  [-] Help test failed: {e}")
-
-    # Test different modes (non-interactive)
-    print("\n2. Testing different application modes...")
-
-    test_cases = [
-        (["--demo", "--no-interactive"], "Demo mode"),
-        (["--debug", "--offline", "--no-interactive"], "Debug mode"),
-        (["--configs", "--no-interactive"], "Config management mode"),
-    ]
-
-    for args, description in test_cases:
-        print(f"\n  Testing: {description}")
-        print(f"  Command: python -m src.rancher_helm_exporter {' '.join(args)}")
-
-        try:
-            # Run with timeout to prevent hanging
-            result = subprocess.run([
-                sys.executable, "-m", "src.rancher_helm_exporter"
-            ] + args, capture_output=True, text=True, cwd=Path(__file__).parent, timeout=15)
-
-            print(f"    Return code: {result.returncode}")
-
-            # Check for expected output patterns
-            if "GRABBY-HELM" in result.stdout:
-                print("    [+] Application banner displayed")
-
-            if args[0].replace("--", "").upper() in result.stdout:
-                print(f"    [+] Mode detected: {args[0]}")
-
-            # Show sample output
-            lines = result.stdout.split('\n')
-            if len(lines) > 1:
-                print("    Sample output:")
-                for line in lines[:8]:  # First few lines
-                    if line.strip():
-                        print(f"      {line}")
-
-            if result.stderr:
-                print("    Errors:")
-                for line in result.stderr.split('\n')[:3]:
-                    if line.strip():
-                        print(f"      {line}")
-
-        except subprocess.TimeoutExpired:
-            print("    [!] Test timed out (may be waiting for input)")
-        except Exception as e:
-            print(f"    [-] Test failed: {e}")
-
-    # Test argument validation
-    print("\n3. Testing argument validation...")
-
-    invalid_cases = [
-        (["--explore", "--demo"], "Multiple state flags should fail"),
-        (["--bulk", "--configs", "--debug"], "Three state flags should fail"),
-    ]
-
-    for args, description in invalid_cases:
-        print(f"\n  Testing: {description}")
-        try:
-            result = subprocess.run([
-                sys.executable, "-m", "src.rancher_helm_exporter"
-            ] + args, capture_output=True, text=True, cwd=Path(__file__).parent, timeout=10)
-
-            if result.returncode != 0:
-                print("    [+] Correctly rejected invalid combination")
-            else:
-                print("    [-] Should have rejected invalid combination")
-
-        except subprocess.TimeoutExpired:
-            print("    [!] Test timed out")
-        except Exception as e:
-            print(f"    [-] Test failed: {e}")
-
-    # Test legacy compatibility
-    print("\n4. Testing legacy compatibility...")
-
-    legacy_cases = [
-        (["--config-prompt"], "Legacy config-prompt should work"),
-        (["--interactive"], "Legacy interactive should work"),
-        (["--demo-mode"], "Legacy demo-mode should work"),
-    ]
-
-    for args, description in legacy_cases:
-        print(f"\n  Testing: {description}")
-        try:
-            result = subprocess.run([
-                sys.executable, "-m", "src.rancher_helm_exporter"
-            ] + args + ["--no-interactive"], capture_output=True, text=True,
-            cwd=Path(__file__).parent, timeout=10)
-
-            if "DEPRECATED" in result.stdout:
-                print("    [+] Legacy warning displayed")
-            else:
-                print("    [!] No deprecation warning shown")
-
-        except subprocess.TimeoutExpired:
-            print("    [!] Test timed out")
-        except Exception as e:
-            print(f"    [-] Test failed: {e}")
-
-    print("\n" + "=" * 50)
-    print("New CLI Structure Test Complete!")
-
-    print("\nNew CLI Usage Examples:")
-    print("  python -m src.rancher_helm_exporter                    # Interactive mode (default)")
-    print("  python -m src.rancher_helm_exporter --explore          # Explore deployments")
-    print("  python -m src.rancher_helm_exporter --configs          # Manage configurations")
-    print("  python -m src.rancher_helm_exporter --bulk             # Bulk export mode")
-    print("  python -m src.rancher_helm_exporter --demo             # Demo with sample data")
-    print("  python -m src.rancher_helm_exporter --debug --offline  # Debug without cluster")
-    print("  python -m src.rancher_helm_exporter --auto-detect      # Auto-detect scope")
-
-if __name__ == "__main__":
-    test_new_cli_structure()
\ No newline at end of file
+        with redirect_stdout(buf_out), redirect_stderr(buf_err):
+            try:
+                main(list(args))
+            except SystemExit as exc:
+                returncode = exc.code if isinstance(exc.code, int) else 1
+    finally:
+        sys.stdin = old_stdin
+    return returncode, buf_out.getvalue(), buf_err.getvalue()
+
+
+@lru_cache(maxsize=None)
+def run_cli_cached(args):
+    """Run the CLI once per distinct argv tuple and reuse the result.
+
+    The checks below only read output; invocations with identical
+    arguments share one run instead of re-executing the CLI per test.
+    """
+    return run_cli(args)
+
+
+@pytest.fixture(scope="module")
+def help_output():
+    """The --help text, produced once for every help-content check."""
+    returncode, stdout, stderr = run_cli_cached(("--help",))
+    assert returncode == 0, stderr
+    return stdout
+
+
+@pytest.fixture(scope="module")
+def help_flags(help_output):
+    """All --long-flag tokens in the help text, indexed in one scan.
+
+    One regex pass builds the set; every flag check afterwards is an
+    O(1) membership test instead of its own substring search over the
+    full help text.
+    """
+    return set(re.findall(r"--[a-z][a-z-]*", help_output))
+
+
+def test_help_has_state_flags(help_flags):
+    for flag in STATE_FLAGS:
+        assert flag in help_flags, f"state flag {flag} missing from --help"
+
+
+def test_help_has_modifier_flags(help_flags):
+    for flag in MODIFIER_FLAGS:
+        assert flag in help_flags, f"modifier flag {flag} missing from --help"
+
+
+def test_help_has_sections(help_output):
+    for section in HELP_SECTIONS:
+        assert section in help_output, f"{section} section missing from --help"
+
+
+@pytest.mark.parametrize(
+    "args,marker",
+    [
+        (("--demo", "--no-interactive"), "DEMO"),
+        (("--debug", "--offline", "--no-interactive"), "DEBUG"),
+        (("--configs", "--no-interactive"), "CONFIGURATION"),
+    ],
+)
+def test_mode_runs_and_announces_itself(args, marker):
+    returncode, stdout, stderr = run_cli_cached(args)
+    assert returncode == 0, stderr
+    assert marker in stdout
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ("--explore", "--demo"),
+        ("--bulk", "--configs", "--debug"),
+    ],
+)
+def test_multiple_state_flags_rejected(args):
+    returncode, stdout, stderr = run_cli_cached(args)
+    assert returncode != 0, "should have rejected combined state flags"
+
+
+@pytest.mark.parametrize(
+    "legacy_flag",
+    ["--config-prompt", "--interactive", "--demo-mode"],
+)
+def test_legacy_flags_warn_deprecated(legacy_flag):
+    returncode, stdout, stderr = run_cli_cached((legacy_flag, "--no-interactive"))
+    assert "DEPRECATED" in stdout
+
+
+def test_module_entrypoint():
+    """Single subprocess check that `python -m rancher_helm_exporter` resolves.
+
+    The in-process helper above covers the CLI logic; this one spawn
+    keeps regression coverage of the __main__ module wiring itself.
+    """
+    result = subprocess.run(
+        _BASE + ["--help"],
+        capture_output=True,
+        text=True,
+        cwd=_CWD,
+        timeout=30,
+    )
+    assert result.returncode == 0, result.stderr
@@ -2,15 +2,145 @@
 from __future__ import annotations
 
 import logging
-from copy import deepcopy
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from string import Template
+from typing import Any, Dict, List, Optional, Set
 
 from .chart_generator import ChartGenerator
 from .constants import K8sFields
 from .types import ExportResult, K8sObject
 from .utils import ManifestTraverser
 
+# Attribute lookups on K8sFields resolve per access; the transform
+# methods hit these names inside nested per-container loops, so they
+# are bound once at module level.
+_F_ANNOTATIONS = K8sFields.ANNOTATIONS
+_F_KIND = K8sFields.KIND
+_F_LABELS = K8sFields.LABELS
+_F_METADATA = K8sFields.METADATA
+_F_NAME = K8sFields.NAME
+_F_REPLICAS = K8sFields.REPLICAS
+_F_SELECTOR = K8sFields.SELECTOR
+_F_SPEC = K8sFields.SPEC
+_F_TEMPLATE = K8sFields.TEMPLATE
+
+
+# Label and annotation keys with "/" or "." are not auto-interned by
+# CPython; interning them lets repeated dict lookups take the
+# pointer-equality fast path instead of rehashing the full string.
+_LBL_APP = sys.intern("app")
+_LBL_NAME = sys.intern("app.kubernetes.io/name")
+_LBL_INSTANCE = sys.intern("app.kubernetes.io/instance")
+_LBL_PART_OF = sys.intern("app.kubernetes.io/part-of")
+_LBL_ENVIRONMENT = sys.intern("environment")
+_LBL_TEST_SUITE = sys.intern("test-suite")
+_ANN_TEST_CHART = sys.intern("helm.sh/test-chart")
+_ANN_DESCRIPTION = sys.intern("description")
+
+
+# Case-insensitive match for database-ish ConfigMap keys; a compiled
+# regex search avoids the per-key .lower() allocation in the data scan.
+_DB_KEY_RE = re.compile(r"database", re.IGNORECASE)
+
+
+class _IdentityDict(dict):
+    """Dict whose missing keys resolve to themselves.
+
+    Lets reference rewrites use plain subscription instead of
+    .get(name, name) at every site; unknown names pass through unchanged
+    without being stored.
+    """
+
+    def __missing__(self, key):
+        return key
+
+
+def _compile_paths(paths: List[str]) -> List[tuple]:
+    """Compile dotted key paths into segment tuples for _apply_mapping.
+
+    Each segment becomes (key, is_list); a trailing "[]" marks a list of
+    dicts to fan out over. Parsing happens once at import time so the
+    walker below only compares precomputed tuples.
+    """
+    compiled = []
+    for path in paths:
+        segments = []
+        for part in path.split("."):
+            if part.endswith("[]"):
+                segments.append((part[:-2], True))
+            else:
+                segments.append((part, False))
+        compiled.append(tuple(segments))
+    return compiled
+
+
+def _apply_mapping(root: Dict, compiled_paths: List[tuple], mapping: Dict[str, str]) -> None:
+    """Rewrite every name field reachable via compiled_paths through mapping.
+
+    Walks only the branches that exist in the manifest; absent keys and
+    wrongly-typed nodes end that path without materializing anything.
+    """
+    for segments in compiled_paths:
+        _walk_path(root, segments, 0, mapping)
+
+
+def _walk_path(node: Any, segments: tuple, index: int, mapping: Dict[str, str]) -> None:
+    if type(node) is not dict:
+        return
+    key, is_list = segments[index]
+    if index == len(segments) - 1:
+        original = node.get(key)
+        if original is not None:
+            node[key] = mapping[original]
+        return
+    child = node.get(key)
+    if is_list:
+        if type(child) is list:
+            for item in child:
+                _walk_path(item, segments, index + 1, mapping)
+    else:
+        _walk_path(child, segments, index + 1, mapping)
+
+
+# Name-bearing paths, relative to a pod spec. Secret volumes carry the
+# reference under secretName; the plain name spelling is kept for
+# manifests that predate it (the two never coexist in practice).
+_POD_SPEC_NAME_PATHS = _compile_paths([
+    "containers[].env[].valueFrom.configMapKeyRef.name",
+    "containers[].env[].valueFrom.secretKeyRef.name",
+    "containers[].envFrom[].configMapRef.name",
+    "containers[].envFrom[].secretRef.name",
+    "volumes[].configMap.name",
+    "volumes[].secret.secretName",
+    "volumes[].secret.name",
+    "volumes[].persistentVolumeClaim.claimName",
+])
+
+# Service references in an Ingress spec, both backend formats.
+_INGRESS_NAME_PATHS = _compile_paths([
+    "rules[].http.paths[].backend.service.name",
+    "rules[].http.paths[].backend.serviceName",
+    "defaultBackend.service.name",
+    "defaultBackend.serviceName",
+])
+
+
+def _fast_clone(obj: Any) -> Any:
+    """Deep-copy a JSON-compatible manifest tree.
+
+    Manifests from kubectl are plain dict/list/scalar trees, so
+    copy.deepcopy's memo dict, __deepcopy__ dispatch, and reconstructor
+    lookups are pure overhead; immutable scalars are shared as-is.
+    """
+    if type(obj) is dict:
+        return {key: _fast_clone(value) for key, value in obj.items()}
+    if type(obj) is list:
+        return [_fast_clone(value) for value in obj]
+    return obj
+
 
 class TestChartGenerator:
     """Generates test charts with modified resource names and configurations."""
@@ -33,63 +163,114 @@ class TestChartGenerator:
         )
         
         self.logger = logging.getLogger(__name__)
-        
-        # Track resource name mappings for cross-references
-        self.name_mappings: Dict[str, str] = {}
+
+        # Track resource name mappings for cross-references; identity
+        # fallback so lookups never need a .get default.
+        self.name_mappings: Dict[str, str] = _IdentityDict()
+
+        # Label/annotation values are the same for every manifest in a
+        # chart build; compute them once instead of re-formatting per
+        # transform call.
+        self._suffix_dash = f"-{test_suffix}"
+        self._instance_label = f"{base_release_name}-{test_suffix}"
+        self._part_of_label = f"{base_release_name}-test-suite"
+
+        # Closed-world kind dispatch: one dict lookup on bound methods
+        # instead of a chain of string comparisons per manifest.
+        self._transforms = {
+            "Deployment": self._transform_deployment,
+            "StatefulSet": self._transform_statefulset,
+            "Service": self._transform_service,
+            "ConfigMap": self._transform_configmap,
+            "Secret": self._transform_secret,
+            "Ingress": self._transform_ingress,
+            "ServiceAccount": self._transform_service_account,
+            "PersistentVolumeClaim": self._transform_pvc,
+        }
+
+        # Chart-invariant files: values.yaml is rendered and encoded
+        # once per instance, and the README template leaves only the
+        # resource count to substitute per build.
+        self._values_yaml_bytes = self._render_test_values().encode("utf-8")
+        self._readme_template = Template(self._render_test_readme_template())
     
     def create_test_chart(
         self,
         manifests: List[K8sObject],
         output_path: str,
         force: bool = False,
+        mutate_in_place: bool = False,
     ) -> List[ExportResult]:
         """
         Create a test chart from existing manifests.
-        
+
         Args:
             manifests: List of Kubernetes manifests to convert
             output_path: Path where the test chart should be created
             force: Whether to overwrite existing directory
-            
+            mutate_in_place: Transform the caller's manifests directly
+                instead of cloning them first. The transforms mutate the
+                tree in place either way; pass True when the originals
+                are not reused afterwards to skip the per-manifest copy.
+
         Returns:
             List of exported test resources
         """
         self.logger.info("Creating test chart: %s", self.test_release_name)
-        
+
         # Create chart structure
         chart_path = self.chart_generator.create_chart_structure(output_path, force)
-        
+
         # Build name mappings first pass
         self._build_name_mappings(manifests)
-        
-        # Transform manifests for test environment
-        test_manifests = []
-        for manifest in manifests:
-            test_manifest = self._transform_manifest_for_test(manifest)
-            if test_manifest:
-                test_manifests.append(test_manifest)
-        
-        # Export test manifests
+
+        # Transform manifests for test environment; one comprehension
+        # instead of a grow-by-append loop.
+        clone = not mutate_in_place
+        test_manifests = [
+            test_manifest
+            for manifest in manifests
+            if (test_manifest := self._transform_manifest_for_test(manifest, clone=clone))
+        ]
+        
+        # Export test manifests. Each write hits its own template file,
+        # so the I/O-bound writes overlap across a small thread pool;
+        # collecting futures in submission order keeps the results
+        # aligned with the manifest list.
         export_results = []
-        for test_manifest in test_manifests:
-            try:
-                result = self.chart_generator.write_manifest(
-                    test_manifest,
-                    str(chart_path),
-                    prefix="test-",
-                )
-                export_results.append(result)
-                
-                self.logger.debug(
-                    "Created test resource: %s/%s",
-                    result.kind,
-                    result.name,
-                )
-                
-            except Exception as e:
-                name = ManifestTraverser.get_manifest_name(test_manifest)
-                kind = test_manifest.get(K8sFields.KIND, "Unknown")
-                self.logger.error("Failed to export test resource %s/%s: %s", kind, name, e)
+        if test_manifests:
+            chart_path_str = str(chart_path)
+            # One level check up front; skips the per-result args tuple
+            # and logging dispatch when debug is off (the common case).
+            debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+            with ThreadPoolExecutor(
+                max_workers=min(8, len(test_manifests))
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        self.chart_generator.write_manifest,
+                        test_manifest,
+                        chart_path_str,
+                        "test-",
+                    )
+                    for test_manifest in test_manifests
+                ]
+                for test_manifest, future in zip(test_manifests, futures):
+                    try:
+                        result = future.result()
+                        export_results.append(result)
+
+                        if debug_enabled:
+                            self.logger.debug(
+                                "Created test resource: %s/%s",
+                                result.kind,
+                                result.name,
+                            )
+
+                    except Exception as e:
+                        name = ManifestTraverser.get_manifest_name(test_manifest)
+                        kind = test_manifest.get(_F_KIND, "Unknown")
+                        self.logger.error("Failed to export test resource %s/%s: %s", kind, name, e)
         
         # Create test-specific values.yaml
         self._create_test_values_file(chart_path)
@@ -104,92 +285,87 @@ class TestChartGenerator:
         return export_results
     
     def _build_name_mappings(self, manifests: List[K8sObject]) -> None:
-        """Build mappings from original names to test names."""
+        """Build mappings from original names to test names.
+
+        One generator feeding dict.update, so the whole table fills in a
+        single C-level pass instead of a method call per manifest;
+        _generate_test_name keeps memoizing any names first seen later.
+        """
+        suffix_dash = self._suffix_dash
+        get_name = ManifestTraverser.get_manifest_name
         self.name_mappings.clear()
-        
-        for manifest in manifests:
-            original_name = ManifestTraverser.get_manifest_name(manifest)
-            if original_name:
-                test_name = self._generate_test_name(original_name)
-                self.name_mappings[original_name] = test_name
+        self.name_mappings.update(
+            (name, name if name.endswith(suffix_dash) else name + suffix_dash)
+            for manifest in manifests
+            if (name := get_name(manifest))
+        )
     
-    def _transform_manifest_for_test(self, manifest: K8sObject) -> Optional[K8sObject]:
+    def _transform_manifest_for_test(
+        self, manifest: K8sObject, clone: bool = True
+    ) -> Optional[K8sObject]:
         """
         Transform a manifest for test environment.
-        
+
         Args:
             manifest: Original manifest
-            
+            clone: Copy the manifest before mutating; pass False when the
+                caller owns the tree and the copy would be wasted work
+
         Returns:
             Transformed test manifest or None if should be skipped
         """
-        test_manifest = deepcopy(manifest)
-        kind = test_manifest.get(K8sFields.KIND, "")
-        
-        # Transform based on resource type
-        if kind == "Deployment":
-            self._transform_deployment(test_manifest)
-        elif kind == "StatefulSet":
-            self._transform_statefulset(test_manifest)
-        elif kind == "Service":
-            self._transform_service(test_manifest)
-        elif kind == "ConfigMap":
-            self._transform_configmap(test_manifest)
-        elif kind == "Secret":
-            self._transform_secret(test_manifest)
-        elif kind == "Ingress":
-            self._transform_ingress(test_manifest)
-        elif kind == "ServiceAccount":
-            self._transform_service_account(test_manifest)
-        elif kind == "PersistentVolumeClaim":
-            self._transform_pvc(test_manifest)
-        else:
-            # Generic transformation for other resource types
-            self._transform_generic_resource(test_manifest)
-        
+        test_manifest = _fast_clone(manifest) if clone else manifest
+        kind = test_manifest.get(_F_KIND, "")
+
+        # Transform based on resource type; unknown kinds fall back to
+        # the generic metadata-only transformation.
+        self._transforms.get(kind, self._transform_generic_resource)(test_manifest)
+
         return test_manifest
     
     def _transform_deployment(self, manifest: K8sObject) -> None:
         """Transform a Deployment for test environment."""
         self._transform_metadata(manifest)
-        
-        spec = manifest.get(K8sFields.SPEC, {})
-        
+
+        # setdefault keeps the replica write when spec is absent; the
+        # .get(..., {}) form silently dropped it into a throwaway dict.
+        spec = manifest.setdefault(_F_SPEC, {})
+
         # Reduce replica count for test environment
-        current_replicas = spec.get(K8sFields.REPLICAS, 1)
+        current_replicas = spec.get(_F_REPLICAS, 1)
         test_replicas = min(current_replicas, 1)  # Max 1 replica for tests
-        spec[K8sFields.REPLICAS] = test_replicas
+        spec[_F_REPLICAS] = test_replicas
         
         # Transform pod template
-        template = spec.get(K8sFields.TEMPLATE, {})
+        template = spec.get(_F_TEMPLATE, {})
         self._transform_pod_template(template)
         
         # Update selector labels
-        selector = spec.get(K8sFields.SELECTOR, {})
-        if K8sFields.LABELS in selector.get("matchLabels", {}):
+        selector = spec.get(_F_SELECTOR, {})
+        if _F_LABELS in selector.get("matchLabels", {}):
             self._transform_labels(selector["matchLabels"])
     
     def _transform_statefulset(self, manifest: K8sObject) -> None:
         """Transform a StatefulSet for test environment."""
         self._transform_deployment(manifest)  # Same transformations as Deployment
         
-        spec = manifest.get(K8sFields.SPEC, {})
+        spec = manifest.get(_F_SPEC, {})
         
         # Transform volume claim templates
         volume_claim_templates = spec.get("volumeClaimTemplates", [])
         for template in volume_claim_templates:
-            if isinstance(template, dict):
+            if type(template) is dict:
                 self._transform_metadata(template)
     
     def _transform_service(self, manifest: K8sObject) -> None:
         """Transform a Service for test environment."""
         self._transform_metadata(manifest)
         
-        spec = manifest.get(K8sFields.SPEC, {})
+        spec = manifest.get(_F_SPEC, {})
         
         # Update selector to match test pods
-        selector = spec.get(K8sFields.SELECTOR, {})
-        if isinstance(selector, dict):
+        selector = spec.get(_F_SELECTOR, {})
+        if type(selector) is dict:
             self._transform_labels(selector)
     
     def _transform_configmap(self, manifest: K8sObject) -> None:
@@ -199,12 +375,12 @@ class TestChartGenerator:
         # ConfigMap data usually doesn't need transformation,
         # but you could modify configuration values here for test environment
         data = manifest.get("data", {})
-        if isinstance(data, dict):
+        if type(data) is dict:
             # Example: Update database names, URLs, etc. for test environment
             for key, value in data.items():
-                if isinstance(value, str):
+                if type(value) is str:
                     # Simple replacement for common test scenarios
-                    if "database" in key.lower() and not value.endswith("-test"):
+                    if _DB_KEY_RE.search(key) and not value.endswith("-test"):
                         data[key] = f"{value}-test"
     
     def _transform_secret(self, manifest: K8sObject) -> None:
@@ -217,23 +393,8 @@ class TestChartGenerator:
         """Transform an Ingress for test environment."""
         self._transform_metadata(manifest)
         
-        spec = manifest.get(K8sFields.SPEC, {})
-        
-        # Update rules to point to test services
-        rules = spec.get(K8sFields.RULES, [])
-        for rule in rules:
-            if isinstance(rule, dict):
-                http = rule.get(K8sFields.HTTP, {})
-                if isinstance(http, dict):
-                    paths = http.get(K8sFields.PATHS, [])
-                    for path in paths:
-                        if isinstance(path, dict):
-                            self._update_backend_service_references(path.get(K8sFields.BACKEND, {}))
-        
-        # Update default backend if present
-        default_backend = spec.get(K8sFields.DEFAULT_BACKEND, {})
-        if default_backend:
-            self._update_backend_service_references(default_backend)
+        # Point rule backends and the default backend at test services.
+        _apply_mapping(manifest.get(_F_SPEC, {}), _INGRESS_NAME_PATHS, self.name_mappings)
     
     def _transform_service_account(self, manifest: K8sObject) -> None:
         """Transform a ServiceAccount for test environment."""
@@ -244,7 +405,7 @@ class TestChartGenerator:
         """Transform a PersistentVolumeClaim for test environment."""
         self._transform_metadata(manifest)
         
-        spec = manifest.get(K8sFields.SPEC, {})
+        spec = manifest.get(_F_SPEC, {})
         
         # Reduce storage size for test environment
         resources = spec.get("resources", {})
@@ -252,7 +413,7 @@ class TestChartGenerator:
         if "storage" in requests:
             # Reduce storage size for tests (e.g., from 10Gi to 1Gi)
             current_storage = requests["storage"]
-            if isinstance(current_storage, str) and "Gi" in current_storage:
+            if type(current_storage) is str and "Gi" in current_storage:
                 try:
                     size = int(current_storage.replace("Gi", ""))
                     test_size = min(size, 1)  # Max 1Gi for tests
@@ -266,155 +427,89 @@ class TestChartGenerator:
     
     def _transform_metadata(self, manifest: K8sObject) -> None:
         """Transform metadata for test environment."""
-        metadata = manifest.get(K8sFields.METADATA, {})
-        if not isinstance(metadata, dict):
+        metadata = manifest.get(_F_METADATA, {})
+        if type(metadata) is not dict:
             return
         
         # Transform name
-        original_name = metadata.get(K8sFields.NAME, "")
+        original_name = metadata.get(_F_NAME, "")
         if original_name:
             test_name = self._generate_test_name(original_name)
-            metadata[K8sFields.NAME] = test_name
+            metadata[_F_NAME] = test_name
         
-        # Transform labels
-        labels = metadata.get(K8sFields.LABELS, {})
-        if isinstance(labels, dict):
+        # Transform labels. setdefault so the test labels land even on
+        # resources that had no labels block at all.
+        labels = metadata.setdefault(_F_LABELS, {})
+        if type(labels) is dict:
             self._transform_labels(labels)
-            
+
             # Add test-specific labels
-            labels["app.kubernetes.io/instance"] = f"{self.base_release_name}-{self.test_suffix}"
-            labels["app.kubernetes.io/part-of"] = f"{self.base_release_name}-test-suite"
-            labels["environment"] = "test"
-        
+            labels[_LBL_INSTANCE] = self._instance_label
+            labels[_LBL_PART_OF] = self._part_of_label
+            labels[_LBL_ENVIRONMENT] = "test"
+
         # Transform annotations
-        annotations = metadata.get(K8sFields.ANNOTATIONS, {})
-        if isinstance(annotations, dict):
-            annotations["helm.sh/test-chart"] = "true"
-            annotations["description"] = f"Test version of {original_name}"
+        annotations = metadata.setdefault(_F_ANNOTATIONS, {})
+        if type(annotations) is dict:
+            annotations[_ANN_TEST_CHART] = "true"
+            annotations[_ANN_DESCRIPTION] = f"Test version of {original_name}"
     
     def _transform_pod_template(self, template: Dict) -> None:
         """Transform pod template metadata and spec."""
-        if not isinstance(template, dict):
+        if type(template) is not dict:
             return
         
         # Transform template metadata
-        template_metadata = template.get(K8sFields.METADATA, {})
-        if isinstance(template_metadata, dict):
-            labels = template_metadata.get(K8sFields.LABELS, {})
-            if isinstance(labels, dict):
+        template_metadata = template.get(_F_METADATA, {})
+        if type(template_metadata) is dict:
+            labels = template_metadata.get(_F_LABELS, {})
+            if type(labels) is dict:
                 self._transform_labels(labels)
                 
                 # Add test-specific pod labels
-                labels["environment"] = "test"
-                labels["test-suite"] = f"{self.base_release_name}-{self.test_suffix}"
+                labels[_LBL_ENVIRONMENT] = "test"
+                labels[_LBL_TEST_SUITE] = self._instance_label
         
         # Transform pod spec
-        pod_spec = template.get(K8sFields.SPEC, {})
-        if isinstance(pod_spec, dict):
+        pod_spec = template.get(_F_SPEC, {})
+        if type(pod_spec) is dict:
             # Transform container references to ConfigMaps/Secrets
             self._transform_container_references(pod_spec)
     
     def _transform_container_references(self, pod_spec: Dict) -> None:
         """Transform container references to ConfigMaps and Secrets."""
-        containers = pod_spec.get(K8sFields.CONTAINERS, [])
-        for container in containers:
-            if isinstance(container, dict):
-                # Transform environment variable references
-                env = container.get(K8sFields.ENV, [])
-                for env_var in env:
-                    if isinstance(env_var, dict):
-                        value_from = env_var.get(K8sFields.VALUE_FROM, {})
-                        self._transform_value_from_references(value_from)
-                
-                # Transform envFrom references
-                env_from = container.get(K8sFields.ENV_FROM, [])
-                for env_source in env_from:
-                    if isinstance(env_source, dict):
-                        config_map_ref = env_source.get(K8sFields.CONFIG_MAP_REF, {})
-                        if K8sFields.NAME in config_map_ref:
-                            original_name = config_map_ref[K8sFields.NAME]
-                            config_map_ref[K8sFields.NAME] = self.name_mappings.get(original_name, original_name)
-                        
-                        secret_ref = env_source.get(K8sFields.SECRET_REF, {})
-                        if K8sFields.NAME in secret_ref:
-                            original_name = secret_ref[K8sFields.NAME]
-                            secret_ref[K8sFields.NAME] = self.name_mappings.get(original_name, original_name)
-        
-        # Transform volume references
-        volumes = pod_spec.get(K8sFields.VOLUMES, [])
-        for volume in volumes:
-            if isinstance(volume, dict):
-                # ConfigMap volumes
-                config_map = volume.get(K8sFields.CONFIG_MAP, {})
-                if K8sFields.NAME in config_map:
-                    original_name = config_map[K8sFields.NAME]
-                    config_map[K8sFields.NAME] = self.name_mappings.get(original_name, original_name)
-                
-                # Secret volumes
-                secret = volume.get(K8sFields.SECRET, {})
-                if K8sFields.SECRET_NAME in secret:
-                    original_name = secret[K8sFields.SECRET_NAME]
-                    secret[K8sFields.SECRET_NAME] = self.name_mappings.get(original_name, original_name)
-                elif K8sFields.NAME in secret:
-                    original_name = secret[K8sFields.NAME]
-                    secret[K8sFields.NAME] = self.name_mappings.get(original_name, original_name)
-                
-                # PVC volumes
-                pvc = volume.get(K8sFields.PERSISTENT_VOLUME_CLAIM, {})
-                if K8sFields.CLAIM_NAME in pvc:
-                    original_name = pvc[K8sFields.CLAIM_NAME]
-                    pvc[K8sFields.CLAIM_NAME] = self.name_mappings.get(original_name, original_name)
-    
-    def _transform_value_from_references(self, value_from: Dict) -> None:
-        """Transform valueFrom references in environment variables."""
-        if not isinstance(value_from, dict):
-            return
-        
-        config_map_ref = value_from.get(K8sFields.CONFIG_MAP_KEY_REF, {})
-        if K8sFields.NAME in config_map_ref:
-            original_name = config_map_ref[K8sFields.NAME]
-            config_map_ref[K8sFields.NAME] = self.name_mappings.get(original_name, original_name)
-        
-        secret_ref = value_from.get(K8sFields.SECRET_KEY_REF, {})
-        if K8sFields.NAME in secret_ref:
-            original_name = secret_ref[K8sFields.NAME]
-            secret_ref[K8sFields.NAME] = self.name_mappings.get(original_name, original_name)
+        _apply_mapping(pod_spec, _POD_SPEC_NAME_PATHS, self.name_mappings)
     
     def _transform_labels(self, labels: Dict) -> None:
         """Transform labels that might reference other resources."""
         # Transform app labels to include test suffix
-        if "app" in labels and not labels["app"].endswith(f"-{self.test_suffix}"):
-            labels["app"] = f"{labels['app']}-{self.test_suffix}"
-        
-        if "app.kubernetes.io/name" in labels:
-            original_name = labels["app.kubernetes.io/name"]
-            labels["app.kubernetes.io/name"] = self._generate_test_name(original_name)
-    
-    def _update_backend_service_references(self, backend: Dict) -> None:
-        """Update service references in ingress backends."""
-        if not isinstance(backend, dict):
-            return
+        if _LBL_APP in labels and not labels[_LBL_APP].endswith(self._suffix_dash):
+            labels[_LBL_APP] = f"{labels[_LBL_APP]}-{self.test_suffix}"
         
-        # New format
-        service = backend.get(K8sFields.SERVICE, {})
-        if K8sFields.NAME in service:
-            original_name = service[K8sFields.NAME]
-            service[K8sFields.NAME] = self.name_mappings.get(original_name, original_name)
-        
-        # Legacy format
-        if K8sFields.SERVICE_NAME in backend:
-            original_name = backend[K8sFields.SERVICE_NAME]
-            backend[K8sFields.SERVICE_NAME] = self.name_mappings.get(original_name, original_name)
+        if _LBL_NAME in labels:
+            original_name = labels[_LBL_NAME]
+            labels[_LBL_NAME] = self._generate_test_name(original_name)
     
     def _generate_test_name(self, original_name: str) -> str:
-        """Generate a test name from an original name."""
-        if original_name.endswith(f"-{self.test_suffix}"):
-            return original_name
-        return f"{original_name}-{self.test_suffix}"
+        """Generate a test name from an original name.
+
+        Results are memoized into name_mappings, so repeat callers
+        (metadata names, app.kubernetes.io/name labels) resolve with one
+        dict lookup instead of re-running the endswith check and
+        f-string per call.
+        """
+        test_name = self.name_mappings.get(original_name)
+        if test_name is None:
+            if original_name.endswith(self._suffix_dash):
+                test_name = original_name
+            else:
+                test_name = original_name + self._suffix_dash
+            self.name_mappings[original_name] = test_name
+        return test_name
     
-    def _create_test_values_file(self, chart_path: Path) -> None:
-        """Create a test-specific values.yaml file."""
-        values_content = f"""# Test values for {self.test_release_name}
+    def _render_test_values(self) -> str:
+        """Render the test-specific values.yaml content."""
+        return f"""# Test values for {self.test_release_name}
 # This file contains test-specific configurations
 
 # Test environment settings
@@ -453,18 +548,25 @@ commonLabels:
   test-suite: "{self.base_release_name}-{self.test_suffix}"
   app.kubernetes.io/part-of: "{self.base_release_name}-test-suite"
 """
-        
+
+    def _create_test_values_file(self, chart_path: Path) -> None:
+        """Create a test-specific values.yaml file."""
         values_path = chart_path / "values.yaml"
-        values_path.write_text(values_content, encoding="utf-8")
-        
+        values_path.write_bytes(self._values_yaml_bytes)
+
         self.logger.debug("Created test values.yaml at: %s", values_path)
-    
-    def _create_test_readme(self, chart_path: Path, resource_count: int) -> None:
-        """Create a test-specific README.md file."""
-        readme_content = f"""# {self.test_release_name}
+
+    def _render_test_readme_template(self) -> str:
+        """Render the README template, leaving only $resource_count open.
+
+        Every other hole depends on instance fields fixed at
+        construction, so the expansion happens once and repeat chart
+        builds only substitute the resource count.
+        """
+        return f"""# {self.test_release_name}
 
 This is a **test chart** generated from the production `{self.base_release_name}` application.
-It contains {resource_count} test resources with `-{self.test_suffix}` suffixed names.
+It contains $resource_count test resources with `-{self.test_suffix}` suffixed names.
 
 ## Purpose
 
@@ -522,8 +624,12 @@ helm uninstall {self.test_release_name}
 - Database names and other configuration may be suffixed with `-test`
 
 """
-        
+
+    def _create_test_readme(self, chart_path: Path, resource_count: int) -> None:
+        """Create a test-specific README.md file."""
+        readme_content = self._readme_template.substitute(resource_count=resource_count)
+
         readme_path = chart_path / "README.md"
         readme_path.write_text(readme_content, encoding="utf-8")
-        
+
         self.logger.debug("Created test README.md at: %s", readme_path)
\ No newline at end of file